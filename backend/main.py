@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -13,9 +16,36 @@ from routes import (
     auth,
     user_content,
 )
-from services.database import client  # Initialize database connection
+from services.admin_service import (
+    start_admin_log_flusher,
+    start_metrics_sampler,
+    stop_admin_log_flusher,
+    stop_metrics_sampler,
+)
+from services.database import (  # Initialize database connection
+    async_client,
+    client,
+    ensure_indexes,
+)
+from services.prefetch import start_prefetcher, stop_prefetcher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await asyncio.to_thread(ensure_indexes)
+    start_admin_log_flusher()
+    start_metrics_sampler()
+    start_prefetcher()
+    try:
+        yield
+    finally:
+        await stop_prefetcher()
+        await stop_metrics_sampler()
+        await stop_admin_log_flusher()
+        async_client.close()
+
 
-app = FastAPI(title="Stock Broker Assistant")
+app = FastAPI(title="Stock Broker Assistant", lifespan=lifespan)
 
 # Enable CORS for frontend development
 app.add_middleware(
@@ -8,6 +8,7 @@ from models.admin import AdminLogCreate, AppSettingsUpdate, UserSettingsUpdate
 from models.user import UserInDB
 from routes.auth import get_current_active_user
 from services.admin_service import AdminService
+from services.market_data import clear_market_data_cache
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -68,6 +69,36 @@ async def get_system_metrics(
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@router.post("/flush-cache")
+async def flush_market_data_cache(
+    current_user: UserInDB = Depends(get_current_active_user),
+) -> Dict[str, Any]:
+    try:
+        cleared = clear_market_data_cache()
+        await AdminService.log_event(
+            AdminLogCreate(
+                level="INFO",
+                message="Flushed market data cache",
+                source="routes.admin_settings.flush_market_data_cache",
+                metadata={
+                    "requested_by": _user_id_str(current_user),
+                    "cleared": cleared,
+                },
+            )
+        )
+        logger.info(
+            "Flushed market data cache",
+            extra={"requested_by": _user_id_str(current_user), "cleared": cleared},
+        )
+        return {
+            "cleared": cleared,
+            "status": "success",
+        }
+    except Exception as exc:
+        logger.exception("Failed to flush market data cache")
+        raise HTTPException(status_code=500, detail=str(exc))
+
+
 @router.get("/settings")
 async def get_application_settings(
     current_user: UserInDB = Depends(get_current_active_user),
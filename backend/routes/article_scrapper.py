@@ -47,6 +47,9 @@ async def scrape_broker_articles(
     websites: Optional[str] = Query(
         default=None, description="Comma-separated list of website URLs"
     ),
+    nlp: bool = Query(
+        default=True, description="Extract article keywords (disable for speed)"
+    ),
 ) -> dict:
     """
     Scrape articles from financial news websites.
@@ -55,6 +58,7 @@ async def scrape_broker_articles(
         count: Number of articles to fetch per website
         max_articles: Maximum number of articles to return after filtering
         websites: Optional comma-separated list of website URLs to scrape
+        nlp: Whether to run keyword extraction on each article
 
     Returns:
         Dictionary containing scraped articles and metadata
@@ -64,7 +68,11 @@ async def scrape_broker_articles(
         website_list = [url.strip() for url in websites.split(",")]
 
     result = await asyncio.to_thread(
-        scrape_articles, websites=website_list, count=count, max_articles=max_articles
+        scrape_articles,
+        websites=website_list,
+        count=count,
+        max_articles=max_articles,
+        nlp=nlp,
     )
 
     if result.get("status") == "success" and result.get("articles"):
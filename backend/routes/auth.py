@@ -1,8 +1,5 @@
-import os
-import secrets
 from datetime import timedelta
 
-from dotenv import load_dotenv
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
@@ -18,15 +15,14 @@ from models.user import (
     ChangePassword,
     ResendVerification,
 )
-from services.auth_service import AuthService
+from services.auth_service import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    ALGORITHM,
+    JWT_KEY,
+    AuthService,
+)
 from services.email_service.sender import EmailSenderError, send_email
 
-load_dotenv()
-
-SECRET_KEY = os.getenv("SECRET_KEY", secrets.token_urlsafe(32))
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
-
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
@@ -39,7 +35,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserInDB:
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, JWT_KEY, algorithms=[ALGORITHM])
         email = payload.get("sub")
         if email is None:
             raise credentials_exception
@@ -201,11 +197,13 @@ async def resend_verification_email(payload: ResendVerification):
 async def change_password(
     payload: ChangePassword, current_user: UserInDB = Depends(get_current_active_user)
 ):
-    if not AuthService.verify_password(
+    if not await AuthService.verify_password_async(
         payload.old_password, current_user.hashed_password
     ):
         raise HTTPException(status_code=400, detail="Incorrect old password")
 
-    hashed_new_password = AuthService.get_password_hash(payload.new_password)
+    hashed_new_password = await AuthService.get_password_hash_async(
+        payload.new_password
+    )
     await AuthService.update_password(current_user.id, hashed_new_password)
     return {"message": "Password changed successfully"}
@@ -2,6 +2,7 @@ from datetime import date, datetime
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from services.market_data import (
@@ -11,8 +12,13 @@ from services.market_data import (
     get_sector_performance as fetch_sector_performance,
     get_watchlist_snapshot,
 )
+from services.prefetch import get_prefetch_stats
 
-router = APIRouter(prefix="/market-summary", tags=["market-summary"])
+router = APIRouter(
+    prefix="/market-summary",
+    tags=["market-summary"],
+    default_response_class=ORJSONResponse,
+)
 
 
 class MarketMetric(BaseModel):
@@ -147,3 +153,17 @@ def get_watchlist_performance(
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/prefetch")
+def get_prefetch_status() -> dict:
+    """
+    Report background prefetch activity and market data cache hit/miss counts.
+
+    Returns:
+        Dictionary with prefetch run counters and cache statistics
+    """
+    return {
+        "prefetch": get_prefetch_stats(),
+        "status": "success",
+    }
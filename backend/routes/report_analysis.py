@@ -241,11 +241,14 @@ async def full_analysis(request: ReportRequest) -> dict:
                 status_code=400, detail="Failed to generate evaluation parameters"
             )
 
-        # Step 2: Evaluate the parameters (returns list)
-        evaluation = generate_evaluated_parameter_code(report_content, parameters)
-
-        # Step 3: Generate summary
-        summary = generate_report_summary(report_content, parameters)
+        # Steps 2 and 3: evaluate the parameters (returns list) and generate the
+        # summary concurrently, off the event loop
+        evaluation, summary = await asyncio.gather(
+            asyncio.to_thread(
+                generate_evaluated_parameter_code, report_content, parameters
+            ),
+            asyncio.to_thread(generate_report_summary, report_content, parameters),
+        )
 
         parameters_payload = [param.model_dump(mode="json") for param in parameters]
 
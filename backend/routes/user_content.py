@@ -13,9 +13,11 @@ from models.user import PyObjectId, UserInDB
 from routes.auth import get_current_active_user
 from services.content_service import (
     add_favorite_article,
+    add_watchlist_symbols,
     get_watchlist,
     list_favorite_articles,
     remove_favorite_article,
+    remove_watchlist_symbols,
     update_watchlist,
 )
 
@@ -47,6 +49,26 @@ async def update_watchlist_endpoint(
     return WatchlistResponse(symbols=record.symbols, updated_at=record.updated_at)
 
 
+@router.post("/watchlist/symbols", response_model=WatchlistResponse)
+async def add_watchlist_symbols_endpoint(
+    payload: WatchlistUpdateRequest,
+    current_user: UserInDB = Depends(get_current_active_user),
+) -> WatchlistResponse:
+    user_id = _ensure_user_id(current_user)
+    record = await add_watchlist_symbols(user_id, payload.symbols)
+    return WatchlistResponse(symbols=record.symbols, updated_at=record.updated_at)
+
+
+@router.delete("/watchlist/symbols/{symbol}", response_model=WatchlistResponse)
+async def remove_watchlist_symbol_endpoint(
+    symbol: str,
+    current_user: UserInDB = Depends(get_current_active_user),
+) -> WatchlistResponse:
+    user_id = _ensure_user_id(current_user)
+    record = await remove_watchlist_symbols(user_id, [symbol])
+    return WatchlistResponse(symbols=record.symbols, updated_at=record.updated_at)
+
+
 @router.get("/favorites", response_model=FavoriteArticlesResponse)
 async def list_favorite_articles_endpoint(
     current_user: UserInDB = Depends(get_current_active_user),
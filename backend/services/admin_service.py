@@ -1,9 +1,13 @@
 import asyncio
 import logging
+import time
+from contextlib import suppress
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
 from bson import ObjectId
+from pymongo import ReturnDocument
 
 from models.admin import (
     AdminLogCreate,
@@ -29,6 +33,40 @@ except ImportError:  # pragma: no cover - optional metrics provider
 
 logger = logging.getLogger("admin.service")
 
+SETTINGS_CACHE_TTL_SECONDS = 60.0
+METRICS_CACHE_TTL_SECONDS = 5.0
+
+# Per-process caches keyed by the monotonic time they were filled at. The locks
+# make concurrent misses share a single refresh instead of stampeding Mongo.
+_settings_cache: Optional[Tuple[float, AppSettings]] = None
+_metrics_cache: Optional[Tuple[float, SystemMetrics]] = None
+_settings_lock = asyncio.Lock()
+_metrics_lock = asyncio.Lock()
+
+METRICS_SAMPLE_INTERVAL_SECONDS = 2.0
+
+
+@dataclass
+class _HostMetrics:
+    uptime_hours: float = 0.0
+    memory_usage_percent: float = 0.0
+    cpu_usage_percent: float = 0.0
+    disk_usage_percent: float = 0.0
+
+
+# Refreshed by a background sampler so cpu_percent always measures a steady
+# interval instead of the gap between whichever two requests happened last.
+_host_metrics = _HostMetrics()
+_metrics_sampler: Optional["asyncio.Task[None]"] = None
+
+LOG_BATCH_SIZE = 256
+LOG_FLUSH_INTERVAL_SECONDS = 0.1
+
+# Admin log events are buffered here and written with insert_many by a
+# background flusher. A None entry tells the flusher to drain and exit.
+_log_queue: "asyncio.Queue[Optional[dict]]" = asyncio.Queue()
+_log_flusher: Optional["asyncio.Task[None]"] = None
+
 
 def _ensure_object_id(value: PyObjectId | ObjectId | str) -> ObjectId:
     if isinstance(value, ObjectId):
@@ -38,53 +76,189 @@ def _ensure_object_id(value: PyObjectId | ObjectId | str) -> ObjectId:
     return ObjectId(str(value))
 
 
+def _cached(entry: Optional[Tuple[float, Any]], ttl: float) -> Optional[Any]:
+    if entry is None:
+        return None
+    filled_at, value = entry
+    if time.monotonic() - filled_at >= ttl:
+        return None
+    return value
+
+
+def invalidate_settings_cache() -> None:
+    global _settings_cache
+    _settings_cache = None
+
+
+def _sample_host_metrics() -> None:
+    boot_time = datetime.fromtimestamp(psutil.boot_time())
+    _host_metrics.uptime_hours = (datetime.now() - boot_time).total_seconds() / 3600
+    _host_metrics.memory_usage_percent = psutil.virtual_memory().percent
+    _host_metrics.cpu_usage_percent = psutil.cpu_percent(interval=None)
+    _host_metrics.disk_usage_percent = psutil.disk_usage("/").percent
+
+
+async def _run_metrics_sampler() -> None:
+    while True:
+        try:
+            _sample_host_metrics()
+        except Exception as exc:  # pragma: no cover - metrics failure fallback
+            logger.debug("Failed to gather system metrics", exc_info=exc)
+        await asyncio.sleep(METRICS_SAMPLE_INTERVAL_SECONDS)
+
+
+def start_metrics_sampler() -> None:
+    global _metrics_sampler
+    if psutil is None:
+        return
+    if _metrics_sampler is None or _metrics_sampler.done():
+        _metrics_sampler = asyncio.create_task(_run_metrics_sampler())
+
+
+async def stop_metrics_sampler() -> None:
+    global _metrics_sampler
+    if _metrics_sampler is None:
+        return
+    _metrics_sampler.cancel()
+    with suppress(asyncio.CancelledError):
+        await _metrics_sampler
+    _metrics_sampler = None
+
+
+async def _write_log_batch(batch: List[dict]) -> None:
+    if not batch:
+        return
+    try:
+        await asyncio.to_thread(admin_logs_collection.insert_many, batch, ordered=False)
+    except Exception as exc:  # pragma: no cover - logging must not break requests
+        logger.warning(
+            "Failed to persist %d admin log events", len(batch), exc_info=exc
+        )
+
+
+async def _flush_admin_logs() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        first = await _log_queue.get()
+        if first is None:
+            break
+        batch = [first]
+        deadline = loop.time() + LOG_FLUSH_INTERVAL_SECONDS
+        stopping = False
+        while len(batch) < LOG_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(_log_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+        await _write_log_batch(batch)
+        if stopping:
+            break
+
+    remaining = []
+    while not _log_queue.empty():
+        item = _log_queue.get_nowait()
+        if item is not None:
+            remaining.append(item)
+    await _write_log_batch(remaining)
+
+
+def start_admin_log_flusher() -> None:
+    global _log_flusher
+    if _log_flusher is None or _log_flusher.done():
+        _log_flusher = asyncio.create_task(_flush_admin_logs())
+
+
+async def stop_admin_log_flusher() -> None:
+    global _log_flusher
+    if _log_flusher is None:
+        return
+    await _log_queue.put(None)
+    await _log_flusher
+    _log_flusher = None
+
+
 class AdminService:
     @staticmethod
     async def get_system_metrics() -> SystemMetrics:
+        global _metrics_cache
+
+        cached = _cached(_metrics_cache, METRICS_CACHE_TTL_SECONDS)
+        if cached is not None:
+            return cached
+
+        async with _metrics_lock:
+            cached = _cached(_metrics_cache, METRICS_CACHE_TTL_SECONDS)
+            if cached is not None:
+                return cached
+            metrics = await AdminService._collect_system_metrics()
+            _metrics_cache = (time.monotonic(), metrics)
+            return metrics
+
+    @staticmethod
+    async def _collect_system_metrics() -> SystemMetrics:
         def _gather_counts():
+            # Filtered count stays exact (the planner picks the is_active index
+            # when it exists); the unfiltered total only needs collection
+            # metadata.
             active_users = users_collection.count_documents({"is_active": True})
-            total_requests = admin_logs_collection.count_documents({})
+            total_requests = admin_logs_collection.estimated_document_count()
             return active_users, total_requests
 
         active_users, total_requests = await asyncio.to_thread(_gather_counts)
 
-        uptime_hours = 0.0
-        memory_usage_percent = 0.0
-        cpu_usage_percent = 0.0
-        disk_usage_percent = 0.0
-
-        if psutil:
+        if psutil and (_metrics_sampler is None or _metrics_sampler.done()):
+            # No sampler running (e.g. outside the app lifespan): sample inline.
             try:
-                boot_time = datetime.fromtimestamp(psutil.boot_time())
-                uptime_hours = (datetime.utcnow() - boot_time).total_seconds() / 3600
-                memory_usage_percent = psutil.virtual_memory().percent
-                cpu_usage_percent = psutil.cpu_percent(interval=None)
-                disk_usage_percent = psutil.disk_usage("/").percent
+                _sample_host_metrics()
             except Exception as exc:  # pragma: no cover - metrics failure fallback
                 logger.debug("Failed to gather system metrics", exc_info=exc)
 
         return SystemMetrics(
-            uptime_hours=uptime_hours,
-            memory_usage_percent=memory_usage_percent,
-            cpu_usage_percent=cpu_usage_percent,
-            disk_usage_percent=disk_usage_percent,
+            uptime_hours=_host_metrics.uptime_hours,
+            memory_usage_percent=_host_metrics.memory_usage_percent,
+            cpu_usage_percent=_host_metrics.cpu_usage_percent,
+            disk_usage_percent=_host_metrics.disk_usage_percent,
             active_users=active_users,
             total_requests=total_requests,
         )
 
     @staticmethod
     async def get_application_settings() -> AppSettings:
+        global _settings_cache
+
+        cached = _cached(_settings_cache, SETTINGS_CACHE_TTL_SECONDS)
+        if cached is not None:
+            return cached
+
+        async with _settings_lock:
+            cached = _cached(_settings_cache, SETTINGS_CACHE_TTL_SECONDS)
+            if cached is not None:
+                return cached
+            settings = await AdminService._load_application_settings()
+            _settings_cache = (time.monotonic(), settings)
+            return settings
+
+    @staticmethod
+    async def _load_application_settings() -> AppSettings:
         def _fetch():
             document = application_settings_collection.find_one({"_id": "default"})
             if document:
                 return document
-            settings = AppSettings()
-            application_settings_collection.update_one(
+            now = datetime.utcnow()
+            defaults = AppSettings(created_at=now, updated_at=now)
+            return application_settings_collection.find_one_and_update(
                 {"_id": "default"},
-                {"$set": settings.model_dump(by_alias=True)},
+                {"$setOnInsert": defaults.model_dump(by_alias=True)},
                 upsert=True,
+                return_document=ReturnDocument.AFTER,
             )
-            return application_settings_collection.find_one({"_id": "default"})
 
         doc = await asyncio.to_thread(_fetch)
         if not doc:
@@ -93,34 +267,44 @@ class AdminService:
 
     @staticmethod
     async def update_application_settings(payload: AppSettingsUpdate) -> AppSettings:
+        global _settings_cache
+
         updates = payload.model_dump(exclude_unset=True)
         if not updates:
             return await AdminService.get_application_settings()
 
-        updates["updated_at"] = datetime.utcnow()
+        now = datetime.utcnow()
+        updates["updated_at"] = now
+
+        defaults = AppSettings(created_at=now).model_dump(
+            by_alias=True, exclude=set(updates)
+        )
 
         def _update():
-            application_settings_collection.update_one(
+            return application_settings_collection.find_one_and_update(
                 {"_id": "default"},
-                {
-                    "$set": updates,
-                    "$setOnInsert": AppSettings().model_dump(by_alias=True),
-                },
+                {"$set": updates, "$setOnInsert": defaults},
                 upsert=True,
+                return_document=ReturnDocument.AFTER,
             )
-            return application_settings_collection.find_one({"_id": "default"})
 
-        doc = await asyncio.to_thread(_update)
-        if not doc:
-            raise RuntimeError("Failed to load application settings after update")
-        return AppSettings(**doc)
+        # Hold the lock across the write so a concurrent cache fill that read
+        # the old document cannot overwrite the fresh settings afterwards.
+        async with _settings_lock:
+            doc = await asyncio.to_thread(_update)
+            if not doc:
+                _settings_cache = None
+                raise RuntimeError("Failed to load application settings after update")
+            settings = AppSettings(**doc)
+            _settings_cache = (time.monotonic(), settings)
+        return settings
 
     @staticmethod
     async def list_users(
         limit: int = 10, offset: int = 0
     ) -> Tuple[int, List[UserPublic]]:
         def _fetch():
-            total = users_collection.count_documents({})
+            total = users_collection.estimated_document_count()
             cursor = (
                 users_collection.find().sort("created_at", -1).skip(offset).limit(limit)
             )
@@ -132,10 +316,13 @@ class AdminService:
     @staticmethod
     async def log_event(event: AdminLogCreate) -> AdminLogRecord:
         document = event.model_dump()
+        document["_id"] = ObjectId()
         document["created_at"] = datetime.utcnow()
 
-        result = await asyncio.to_thread(admin_logs_collection.insert_one, document)
-        document["_id"] = result.inserted_id
+        if _log_flusher is not None and not _log_flusher.done():
+            await _log_queue.put(document)
+        else:
+            await asyncio.to_thread(admin_logs_collection.insert_one, document)
         return AdminLogRecord(**document)
 
     @staticmethod
@@ -164,17 +351,18 @@ class AdminService:
         if doc:
             return UserSettings(**doc)
 
-        settings = UserSettings(user_id=PyObjectId(str(user_id)))
-        await asyncio.to_thread(
-            user_settings_collection.update_one,
+        now = datetime.utcnow()
+        settings = UserSettings(
+            user_id=PyObjectId(str(user_id)), created_at=now, updated_at=now
+        )
+        stored = await asyncio.to_thread(
+            user_settings_collection.find_one_and_update,
             {"user_id": user_id},
             {
-                "$setOnInsert": settings.model_dump(by_alias=True),
+                "$setOnInsert": settings.model_dump(by_alias=True, exclude={"id"}),
             },
             upsert=True,
-        )
-        stored = await asyncio.to_thread(
-            user_settings_collection.find_one, {"user_id": user_id}
+            return_document=ReturnDocument.AFTER,
         )
         if not stored:
             raise RuntimeError("User settings not found after initialization")
@@ -188,26 +376,30 @@ class AdminService:
         if not updates:
             return await AdminService.get_user_settings(user_id)
 
-        updates["updated_at"] = datetime.utcnow()
+        now = datetime.utcnow()
+        updates["updated_at"] = now
 
-        await asyncio.to_thread(
-            user_settings_collection.update_one,
-            {"user_id": user_id},
-            {
-                "$set": updates,
-                "$setOnInsert": UserSettings(
-                    user_id=PyObjectId(str(user_id))
-                ).model_dump(by_alias=True),
-            },
-            upsert=True,
-        )
+        defaults = UserSettings(
+            user_id=PyObjectId(str(user_id)), created_at=now
+        ).model_dump(by_alias=True, exclude={"id", *updates})
 
         stored = await asyncio.to_thread(
-            user_settings_collection.find_one, {"user_id": user_id}
+            user_settings_collection.find_one_and_update,
+            {"user_id": user_id},
+            {"$set": updates, "$setOnInsert": defaults},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
         )
         if not stored:
             raise RuntimeError("User settings not found after update")
         return UserSettings(**stored)
 
 
-__all__ = ["AdminService"]
+__all__ = [
+    "AdminService",
+    "invalidate_settings_cache",
+    "start_metrics_sampler",
+    "stop_metrics_sampler",
+    "start_admin_log_flusher",
+    "stop_admin_log_flusher",
+]
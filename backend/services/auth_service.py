@@ -1,4 +1,5 @@
 import asyncio
+import concurrent.futures
 import os
 import secrets
 from datetime import datetime, timedelta
@@ -6,7 +7,7 @@ from typing import Optional
 
 import bcrypt
 from dotenv import load_dotenv
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 
 from models.user import UserCreate, UserInDB
 from services.database import users_collection
@@ -15,8 +16,26 @@ load_dotenv()
 
 SECRET_KEY = os.getenv("SECRET_KEY", secrets.token_urlsafe(32))
 ALGORITHM = "HS256"
+# Built once so jose does not re-parse the secret and rebuild the HMAC key on
+# every encode/decode.
+JWT_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 MAX_PASSWORD_BYTES = 72
+# Cost factor for new hashes. Existing hashes carry their own cost, so changing
+# this only affects passwords hashed from now on.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
+
+# Fields needed to build a UserInDB for auth flows; skips reset-token state and
+# any larger profile data stored alongside the user.
+_AUTH_PROJECTION = {
+    "email": 1,
+    "username": 1,
+    "hashed_password": 1,
+    "is_active": 1,
+    "is_verified": 1,
+    "created_at": 1,
+    "updated_at": 1,
+}
 
 
 def _password_to_bytes(password: str) -> bytes:
@@ -28,6 +47,21 @@ def _password_to_bytes(password: str) -> bytes:
     return password_bytes
 
 
+# bcrypt is CPU-bound; keep it off the default executor that the Mongo calls
+# share so a burst of logins cannot queue ahead of database work.
+_BCRYPT_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="bcrypt"
+)
+
+# Hashed once at import so lookups for unknown users can still pay for a full
+# bcrypt check; otherwise login latency reveals whether an account exists.
+# Existing accounts were hashed at bcrypt's default cost of 12, so the dummy
+# check must not be cheaper than that.
+_DUMMY_HASH = bcrypt.hashpw(
+    b"x" * 8, bcrypt.gensalt(rounds=max(BCRYPT_ROUNDS, 12))
+).decode("utf-8")
+
+
 class AuthService:
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -52,9 +86,23 @@ class AuthService:
     @staticmethod
     def get_password_hash(password: str) -> str:
         password_bytes = _password_to_bytes(password)
-        hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt())
+        hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
         return hashed.decode("utf-8")
 
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _BCRYPT_POOL, AuthService.verify_password, plain_password, hashed_password
+        )
+
+    @staticmethod
+    async def get_password_hash_async(password: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _BCRYPT_POOL, AuthService.get_password_hash, password
+        )
+
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         to_encode = data.copy()
@@ -63,12 +111,14 @@ class AuthService:
         else:
             expire = datetime.utcnow() + timedelta(minutes=15)
         to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        encoded_jwt = jwt.encode(to_encode, JWT_KEY, algorithm=ALGORITHM)
         return encoded_jwt
 
     @staticmethod
     async def get_user_by_email(email: str) -> Optional[UserInDB]:
-        user_dict = await asyncio.to_thread(users_collection.find_one, {"email": email})
+        user_dict = await asyncio.to_thread(
+            users_collection.find_one, {"email": email}, _AUTH_PROJECTION
+        )
         if user_dict:
             return UserInDB(**user_dict)
         return None
@@ -76,7 +126,23 @@ class AuthService:
     @staticmethod
     async def get_user_by_username(username: str) -> Optional[UserInDB]:
         user_dict = await asyncio.to_thread(
-            users_collection.find_one, {"username": username}
+            users_collection.find_one, {"username": username}, _AUTH_PROJECTION
+        )
+        if user_dict:
+            return UserInDB(**user_dict)
+        return None
+
+    @staticmethod
+    async def get_user_by_identifier(identifier: str) -> Optional[UserInDB]:
+        user_dict = await asyncio.to_thread(
+            users_collection.find_one,
+            {
+                "$or": [
+                    {"email": identifier},
+                    {"username": identifier},
+                ]
+            },
+            _AUTH_PROJECTION,
         )
         if user_dict:
             return UserInDB(**user_dict)
@@ -96,11 +162,12 @@ class AuthService:
         if existing_user:
             raise ValueError("User with this email or username already exists")
 
+        hashed_password = await AuthService.get_password_hash_async(user.password)
         now = datetime.utcnow()
         user_document = {
             "email": user.email,
             "username": user.username,
-            "hashed_password": AuthService.get_password_hash(user.password),
+            "hashed_password": hashed_password,
             "is_active": True,
             "is_verified": False,
             "created_at": now,
@@ -113,12 +180,11 @@ class AuthService:
 
     @staticmethod
     async def authenticate_user(identifier: str, password: str) -> Optional[UserInDB]:
-        user = await AuthService.get_user_by_email(identifier)
-        if not user:
-            user = await AuthService.get_user_by_username(identifier)
+        user = await AuthService.get_user_by_identifier(identifier)
         if not user:
+            await AuthService.verify_password_async(password, _DUMMY_HASH)
             return None
-        if not AuthService.verify_password(password, user.hashed_password):
+        if not await AuthService.verify_password_async(password, user.hashed_password):
             return None
         return user
 
@@ -129,7 +195,8 @@ class AuthService:
             raise ValueError("User not found")
 
         reset_token = secrets.token_urlsafe(32)
-        expires = datetime.utcnow() + timedelta(hours=1)
+        now = datetime.utcnow()
+        expires = now + timedelta(hours=1)
 
         await asyncio.to_thread(
             users_collection.update_one,
@@ -138,7 +205,7 @@ class AuthService:
                 "$set": {
                     "reset_token": reset_token,
                     "reset_token_expires": expires,
-                    "updated_at": datetime.utcnow(),
+                    "updated_at": now,
                 }
             },
         )
@@ -152,6 +219,7 @@ class AuthService:
                 "reset_token": token,
                 "reset_token_expires": {"$gt": datetime.utcnow()},
             },
+            _AUTH_PROJECTION,
         )
         if user_dict:
             return UserInDB(**user_dict)
@@ -163,17 +231,18 @@ class AuthService:
         if not user:
             return False
 
-        hashed_password = AuthService.get_password_hash(new_password)
+        hashed_password = await AuthService.get_password_hash_async(new_password)
         await asyncio.to_thread(
             users_collection.update_one,
             {"_id": user.id},
             {
                 "$set": {
                     "hashed_password": hashed_password,
-                    "reset_token": None,
-                    "reset_token_expires": None,
                     "updated_at": datetime.utcnow(),
-                }
+                },
+                # Unset rather than null out: the sparse unique reset_token
+                # index still indexes explicit nulls.
+                "$unset": {"reset_token": "", "reset_token_expires": ""},
             },
         )
         return True
@@ -181,7 +250,7 @@ class AuthService:
     @staticmethod
     async def verify_email_token(token: str) -> Optional[UserInDB]:
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            payload = jwt.decode(token, JWT_KEY, algorithms=[ALGORITHM])
             email = payload.get("sub")
             if email is None:
                 return None
@@ -1,11 +1,35 @@
+import functools
+import heapq
 import os
+import re
 import shutil
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Iterator
+from urllib.parse import urlparse
 from nltk.data import find
+from nltk.tokenize import PunktTokenizer
 import nltk
 import newspaper
-import json
+from newspaper import network as newspaper_network
+from newspaper import nlp as newspaper_nlp
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 
 
+# nltk.data.find() needs the category-qualified path; a bare package name never
+# resolves, which used to send every process start through nltk.download().
+NLTK_RESOURCE_PATHS = {
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+    "stopwords": "corpora/stopwords",
+}
+
+
+@functools.lru_cache(maxsize=None)
 def ensure_nltk_resource(resource_name):
     nltk_data_dir = os.path.join(
         os.path.dirname(
@@ -15,15 +39,23 @@ def ensure_nltk_resource(resource_name):
         ),
         "nltk_data",
     )
-    os.makedirs(nltk_data_dir, exist_ok=True)
 
     if nltk_data_dir not in nltk.data.path:
-        nltk.data.path.append(nltk_data_dir)
+        nltk.data.path.insert(0, nltk_data_dir)
 
+    resource_path = NLTK_RESOURCE_PATHS.get(resource_name, resource_name)
     try:
-        find(resource_name)
+        find(resource_path)
+        return
 
     except LookupError:
+        if os.getenv("NLTK_DATA_PREBUILT") == "1":
+            print(
+                f"Warning: NLTK resource '{resource_name}' missing from prebuilt data; skipping download"
+            )
+            return
+
+        os.makedirs(nltk_data_dir, exist_ok=True)
         print(
             f"NLTK resource not found: {resource_name}. Attempting download into {nltk_data_dir}"
         )
@@ -45,7 +77,7 @@ def ensure_nltk_resource(resource_name):
 
         # final attempt to locate the resource (no exception raised here intentionally)
         try:
-            find(resource_name)
+            find(resource_path)
         except LookupError:
             print(
                 f"Warning: NLTK resource '{resource_name}' still not found after download attempts."
@@ -56,6 +88,42 @@ ensure_nltk_resource("punkt")
 ensure_nltk_resource("punkt_tab")
 ensure_nltk_resource("stopwords")
 
+# nltk.data.load() answers every "tokenizers/punkt/*.pickle" request with a new
+# PunktTokenizer built from punkt_tab on disk, bypassing its resource cache.
+# Memoize that constructor so any remaining caller shares one instance.
+if hasattr(nltk.data, "switch_punkt"):
+    nltk.data.switch_punkt = functools.lru_cache(maxsize=8)(nltk.data.switch_punkt)
+
+
+def _install_shared_punkt_tokenizer():
+    """
+    Makes newspaper's sentence splitter reuse one Punkt tokenizer.
+
+    newspaper calls nltk.data.load("tokenizers/punkt/english.pickle") for every
+    article, which on current NLTK rebuilds a PunktTokenizer from disk each time.
+    """
+    try:
+        tokenizer = PunktTokenizer("english")
+    except LookupError:
+        print("Warning: punkt_tab unavailable, keeping newspaper's sentence splitter")
+        return
+
+    def split_sentences(text):
+        sentences = tokenizer.tokenize(text)
+        return [x.replace("\n", "") for x in sentences if len(x) > 10]
+
+    newspaper_nlp.split_sentences = split_sentences
+
+
+_install_shared_punkt_tokenizer()
+
+# Article.nlp() calls load_stopwords() for every article, re-reading the
+# stopwords file into newspaper's global set. The result only depends on the
+# language, so read each file once per process.
+newspaper_nlp.load_stopwords = functools.lru_cache(maxsize=None)(
+    newspaper_nlp.load_stopwords
+)
+
 # Path to the cache folder
 CACHE_FOLDER = os.path.join(
     os.path.dirname(__file__),
@@ -67,9 +135,21 @@ def clear_cache():
     """
     Clears the newspaper cache folder to force fresh scraping of all articles.
     """
+    with _site_links_lock:
+        _site_links.clear()
+
     if os.path.exists(CACHE_FOLDER):
         try:
-            shutil.rmtree(CACHE_FOLDER)  # Delete the cache folder
+            # Renaming is atomic and O(1); the slow recursive delete of the
+            # renamed folder runs in the background so callers return at once.
+            trash = f"{CACHE_FOLDER}.gc-{os.getpid()}-{time.time_ns()}"
+            os.rename(CACHE_FOLDER, trash)
+            threading.Thread(
+                target=shutil.rmtree,
+                args=(trash,),
+                kwargs={"ignore_errors": True},
+                daemon=True,
+            ).start()
             print("Cache cleared successfully.")
 
         except Exception as e:
@@ -79,71 +159,205 @@ def clear_cache():
         print("No cache to clear.")
 
 
-def scrape(websites: list, count: int = 5) -> list:
+# Article downloads are network-bound, so fan them out across a thread pool,
+# but cap in-flight requests per host so a single site is not hammered.
+MAX_FETCH_WORKERS = 16
+MAX_REQUESTS_PER_DOMAIN = 5
+
+_domain_slots: dict[str, threading.BoundedSemaphore] = {}
+_domain_slots_lock = threading.Lock()
+
+
+def _domain_slot(url: str) -> threading.BoundedSemaphore:
+    domain = urlparse(url).netloc
+    with _domain_slots_lock:
+        slot = _domain_slots.get(domain)
+        if slot is None:
+            slot = threading.BoundedSemaphore(MAX_REQUESTS_PER_DOMAIN)
+            _domain_slots[domain] = slot
+        return slot
+
+
+# One pooled session for article downloads so repeat hits on the same host reuse
+# the TCP/TLS connection; newspaper's own download() opens a new one per URL.
+_http_session = requests.Session()
+_http_session.mount(
+    "http://", HTTPAdapter(pool_connections=32, pool_maxsize=MAX_FETCH_WORKERS)
+)
+_http_session.mount(
+    "https://", HTTPAdapter(pool_connections=32, pool_maxsize=MAX_FETCH_WORKERS)
+)
+
+
+def _download_html(article) -> str:
+    config = article.config
+    response = _http_session.get(
+        article.url,
+        **newspaper_network.get_request_kwargs(
+            config.request_timeout,
+            config.browser_user_agent,
+            config.proxies,
+            config.headers,
+        ),
+    )
+    if config.http_success_only:
+        response.raise_for_status()
+    return newspaper_network.get_html_2XX_only(article.url, config, response=response)
+
+
+# Shared newspaper settings. fetch_images=False takes the thumbnail from the page
+# markup instead of downloading candidate images to measure them.
+_NEWSPAPER_CONFIG = newspaper.Config()
+_NEWSPAPER_CONFIG.language = "en"
+_NEWSPAPER_CONFIG.memoize_articles = False
+_NEWSPAPER_CONFIG.fetch_images = False
+
+# Front-page link sets per site, reused by back-to-back scrapes for a while
+# instead of re-downloading and re-extracting every category page.
+SITE_LINKS_TTL_SECONDS = 600.0
+
+_site_links: dict[str, tuple[float, list[str]]] = {}
+_site_links_lock = threading.Lock()
+
+
+def _site_article_urls(website: str) -> list[str]:
+    now = time.monotonic()
+    with _site_links_lock:
+        cached = _site_links.get(website)
+    if cached is not None and now - cached[0] < SITE_LINKS_TTL_SECONDS:
+        return cached[1]
+
+    site = newspaper.build(website, config=_NEWSPAPER_CONFIG)
+    urls = site.article_urls()
+    print(f"Links from {website} = {len(urls)}")
+    with _site_links_lock:
+        _site_links[website] = (now, urls)
+    return urls
+
+
+# Hardware-brand promos and boilerplate bodies that slip through as "articles"
+UNWANTED_BRANDS_RE = re.compile(r"\b(?:dell|hp|acer|lenovo)\b", re.IGNORECASE)
+UNWANTED_TEXTS = frozenset(
+    {
+        "",
+        "Get App for Better Experience",
+        "Log onto movie.ndtv.com for more celebrity pictures",
+        "No description available.",
+    }
+)
+
+
+def _fetch_article(article, nlp: bool = False) -> dict | None:
+    """
+    Downloads and parses a single newspaper article, optionally running NLP.
+
+    Args:
+        article (newspaper.Article): The article to process.
+        nlp (bool): Whether to run keyword extraction/summarization.
+
+    Returns:
+        dict | None: The article metadata, or None if processing failed.
+    """
+    try:
+        with _domain_slot(article.url):
+            html = _download_html(article)
+        article.download(input_html=html)
+        article.parse()
+
+        # Drop empty and unwanted articles before paying for nlp()
+        if not (article.title and article.text):
+            return None
+        if UNWANTED_BRANDS_RE.search(article.title) or article.text in UNWANTED_TEXTS:
+            return None
+
+        if nlp:
+            article.nlp()
+
+        return {
+            "link": article.url,
+            "title": article.title,
+            "text": article.text,
+            "author": article.authors,
+            "publish_date": (
+                article.publish_date.strftime("%Y-%m-%d")
+                if article.publish_date
+                else None
+            ),
+            "keywords": article.keywords,
+            "tags": list(article.tags),
+            "thumbnail": article.top_image,
+        }
+
+    except Exception as e:
+        print(f"Failed to parse article: {article.url}. Error: {e}")
+        return None
+
+
+def scrape(websites: list, count: int = 5, nlp: bool = False) -> Iterator[dict]:
     """
     Scrapes articles from a list of websites and extracts metadata, including thumbnails.
 
+    Articles are yielded as soon as they are parsed, so callers can consume
+    them without holding the whole crawl in memory.
+
     Args:
         websites (list): A list of website URLs to scrape.
         count (int): Maximum number of articles to fetch per website.
+        nlp (bool): Whether to extract keywords with newspaper's NLP step.
 
-    Returns:
-        list: A list of dictionaries, each containing metadata and content for an article.
+    Yields:
+        dict: Metadata and content for one article.
     """
-    articles_data = []
-    temp = count
-
-    for website in websites:
-        temp = count
-        try:
-            site = newspaper.build(
-                website,
-                language="en",
-                memorize=False,
-            )
-            print(f"Links from {website} = {len(site.articles)}")
+    total = 0
+    # URLs already queued, so links shared between sites are fetched only once
+    seen_urls: set[str] = set()
+
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+        # Site builds are network-bound too, so start them all at once.
+        site_futures = {
+            pool.submit(_site_article_urls, website): website
+            for website in websites
+        }
+        # Finished futures leave this set, so their results can be freed as
+        # soon as the consumer has seen them.
+        pending = set(site_futures)
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                website = site_futures.pop(future, None)
+                if website is None:
+                    article_data = future.result()
+                    if article_data:
+                        total += 1
+                        yield article_data
+                    continue
 
-            for article in site.articles:
                 try:
-                    if temp == 0:
-                        break
-                    article.download()
-                    article.parse()
-                    article.nlp()
-
-                    articles_data.append(
-                        {
-                            "link": article.url,
-                            "title": article.title,
-                            "text": article.text,
-                            "author": article.authors,
-                            "publish_date": (
-                                article.publish_date.strftime("%Y-%m-%d")
-                                if article.publish_date
-                                else None
-                            ),
-                            "keywords": article.keywords,
-                            "tags": list(article.tags),
-                            "thumbnail": article.top_image,
-                        }
-                    )
-                    temp -= 1
-
+                    urls = future.result()
                 except Exception as e:
-                    print(f"Failed to parse article: {article.url}. Error: {e}")
+                    print(f"Failed to process website: {website}. Error: {e}")
                     continue
 
-        except Exception as e:
-            print(f"Failed to process website: {website}. Error: {e}")
-            continue
+                unseen = (url for url in urls if url not in seen_urls)
+                for url in islice(unseen, count):
+                    seen_urls.add(url)
+                    article = newspaper.Article(url, config=_NEWSPAPER_CONFIG)
+                    pending.add(pool.submit(_fetch_article, article, nlp))
 
     print("**Finished Parsing**")
-    print(f"Total Articles - {len(articles_data)}")
-    return articles_data
+    print(f"Total Articles - {total}")
+
+
+def _publish_date(article: dict) -> str:
+    return article.get("publish_date") or "0000-00-00"
 
 
 def scrape_articles(
-    websites: list | None = None, count: int = 5, max_articles: int = 1500
+    websites: list | None = None,
+    count: int = 5,
+    max_articles: int = 1500,
+    nlp: bool = False,
 ) -> dict:
     """
     Scrapes articles from a list of websites and returns structured data.
@@ -152,6 +366,7 @@ def scrape_articles(
         websites (list): A list of website URLs to scrape. If None, uses default websites.
         count (int): Maximum number of articles to fetch per website.
         max_articles (int): Maximum number of articles to return after filtering.
+        nlp (bool): Whether to extract keywords with newspaper's NLP step.
 
     Returns:
         dict: A dictionary containing the scraped articles and metadata.
@@ -165,11 +380,14 @@ def scrape_articles(
             "https://www.cnbctv18.com/"
         ]
 
-    # Scrape articles
-    results = scrape(websites, count=count)
-    valid_results = [r for r in results if r.get("title") and r.get("text")]
+    # Scrape articles (empty and unwanted ones are dropped during the fetch) and
+    # keep the max_articles most recent by publish_date. nlargest consumes the
+    # stream with an O(max_articles) heap and returns them already sorted.
+    filtered_results = heapq.nlargest(
+        max_articles, scrape(websites, count=count, nlp=nlp), key=_publish_date
+    )
 
-    if not valid_results:
+    if not filtered_results:
         return {
             "status": "success",
             "message": "No valid articles found",
@@ -177,34 +395,6 @@ def scrape_articles(
             "articles": [],
         }
 
-    # Remove unwanted articles by title and text
-    unwanted_texts = [
-        "",
-        "Get App for Better Experience",
-        "Log onto movie.ndtv.com for more celebrity pictures",
-        "No description available.",
-    ]
-    filtered_results = [
-        r
-        for r in valid_results
-        if not (
-            r["title"]
-            and any(
-                brand in r["title"].lower()
-                for brand in ["dell", "hp", "acer", "lenovo"]
-            )
-            or r["text"] in unwanted_texts
-        )
-    ]
-
-    # Limit to max_articles most recent articles by publish_date (if available)
-    def get_date(article):
-        return article.get("publish_date") or "0000-00-00"
-
-    filtered_results.sort(key=get_date)
-    if len(filtered_results) > max_articles:
-        filtered_results = filtered_results[-max_articles:]
-
     return {
         "status": "success",
         "message": f"Successfully scraped {len(filtered_results)} articles",
@@ -213,18 +403,29 @@ def scrape_articles(
     }
 
 
+def save_to_jsonl(articles: list, output_file: str) -> None:
+    """
+    Appends articles to a newline-delimited JSON file, one record per line.
+
+    Args:
+        articles (list): The article dictionaries to write.
+        output_file (str): Path of the .jsonl file to append to.
+    """
+    with open(output_file, "ab", buffering=1 << 20) as jsonl_file:
+        jsonl_file.writelines(orjson.dumps(article) + b"\n" for article in articles)
+
+
 def main():
     """
     Main function for backwards compatibility and testing.
-    Now uses scrape_articles and optionally saves to JSON.
+    Now uses scrape_articles and optionally appends the results to JSONL.
     """
-    result = scrape_articles(count=5000)
+    result = scrape_articles(count=5000, nlp=True)
 
     if result["status"] == "success" and result["total_articles"] > 0:
-        # Optionally save to JSON file for backwards compatibility
-        output_file = os.path.join(os.path.dirname(__file__), "articles.json")
-        with open(output_file, "w", encoding="utf-8") as json_file:
-            json.dump(result["articles"], json_file, ensure_ascii=False, indent=4)
+        # Optionally save to a JSONL file for backwards compatibility
+        output_file = os.path.join(os.path.dirname(__file__), "articles.jsonl")
+        save_to_jsonl(result["articles"], output_file)
         print(f"Scraping completed! Articles saved: {result['total_articles']}")
     else:
         print(result["message"])
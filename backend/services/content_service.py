@@ -1,10 +1,12 @@
-import asyncio
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Union
 from urllib.parse import urlparse
 
 from bson import ObjectId
+from pydantic import BaseModel
+from pymongo import ReturnDocument, UpdateOne
 
 from models.content import (
     ArticleCreate,
@@ -17,15 +19,27 @@ from models.content import (
 )
 from models.user import PyObjectId
 from services.database import (
-    articles_collection,
-    favorite_articles_collection,
-    financial_analysis_collection,
-    market_filings_collection,
-    report_analysis_collection,
-    watchlists_collection,
+    async_articles_collection as articles_collection,
+    async_favorite_articles_collection as favorite_articles_collection,
+    async_financial_analysis_collection as financial_analysis_collection,
+    async_market_filings_collection as market_filings_collection,
+    async_report_analysis_collection as report_analysis_collection,
+    async_watchlists_collection as watchlists_collection,
 )
 
 
+def _model_projection(model: type[BaseModel]) -> Dict[str, int]:
+    """Project exactly the stored fields a record model reads."""
+    return {field.alias or name: 1 for name, field in model.model_fields.items()}
+
+
+_ARTICLE_PROJECTION = _model_projection(ArticleInDB)
+_MARKET_FILING_PROJECTION = _model_projection(MarketFilingRecord)
+_REPORT_ANALYSIS_PROJECTION = _model_projection(ReportAnalysisRecord)
+_FINANCIAL_ANALYSIS_PROJECTION = _model_projection(FinancialAnalysisRecord)
+
+
+@lru_cache(maxsize=4096)
 def _domain_from_link(link: Optional[str]) -> Optional[str]:
     if not link:
         return None
@@ -54,8 +68,7 @@ async def save_articles(articles: Iterable[ArticleCreate]) -> int:
             "updated_at": now,
         }
         operations.append(
-            asyncio.to_thread(
-                articles_collection.update_one,
+            UpdateOne(
                 {"link": article.link},
                 {"$set": set_fields, "$setOnInsert": {"created_at": now}},
                 upsert=True,
@@ -63,49 +76,50 @@ async def save_articles(articles: Iterable[ArticleCreate]) -> int:
         )
     if not operations:
         return 0
-    await asyncio.gather(*operations)
-    return len(operations)
+    result = await articles_collection.bulk_write(operations, ordered=False)
+    return result.upserted_count + result.modified_count
 
 
 async def list_articles(limit: int = 50, skip: int = 0) -> List[ArticleInDB]:
-    def _fetch():
-        cursor = (
-            articles_collection.find().sort("created_at", -1).skip(skip).limit(limit)
-        )
-        return list(cursor)
-
-    docs = await asyncio.to_thread(_fetch)
-    return [ArticleInDB(**doc) for doc in docs]
+    cursor = (
+        articles_collection.find(projection=_ARTICLE_PROJECTION)
+        .sort("created_at", -1)
+        .skip(skip)
+        .limit(limit)
+    )
+    return [ArticleInDB(**doc) async for doc in cursor]
 
 
 async def save_market_filings(source: str, filings: List[dict]) -> None:
     now = datetime.utcnow()
-
-    async def _upsert(filing: dict):
+    operations = []
+    for filing in filings:
+        if not filing:
+            continue
         link = (filing.get("link") or "").strip()
         if not link:
-            return
+            continue
 
         meta = {k: v for k, v in filing.items() if k not in {"title", "link"}}
-        await asyncio.to_thread(
-            market_filings_collection.update_one,
-            {"source": source, "link": link},
-            {
-                "$set": {
-                    "source": source,
-                    "title": filing.get("title") or filing.get("company") or "",
-                    "link": link,
-                    "meta": meta,
-                    "updated_at": now,
+        operations.append(
+            UpdateOne(
+                {"source": source, "link": link},
+                {
+                    "$set": {
+                        "source": source,
+                        "title": filing.get("title") or filing.get("company") or "",
+                        "link": link,
+                        "meta": meta,
+                        "updated_at": now,
+                    },
+                    "$setOnInsert": {"created_at": now},
                 },
-                "$setOnInsert": {"created_at": now},
-            },
-            upsert=True,
+                upsert=True,
+            )
         )
 
-    tasks = [_upsert(filing) for filing in filings if filing]
-    if tasks:
-        await asyncio.gather(*tasks)
+    if operations:
+        await market_filings_collection.bulk_write(operations, ordered=False)
 
 
 async def list_market_filings(
@@ -113,14 +127,12 @@ async def list_market_filings(
 ) -> List[MarketFilingRecord]:
     query = {"source": source} if source else {}
 
-    def _fetch():
-        cursor = (
-            market_filings_collection.find(query).sort("created_at", -1).limit(limit)
-        )
-        return list(cursor)
-
-    docs = await asyncio.to_thread(_fetch)
-    return [MarketFilingRecord(**doc) for doc in docs]
+    cursor = (
+        market_filings_collection.find(query, _MARKET_FILING_PROJECTION)
+        .sort("created_at", -1)
+        .limit(limit)
+    )
+    return [MarketFilingRecord(**doc) async for doc in cursor]
 
 
 async def save_report_analysis(
@@ -141,19 +153,19 @@ async def save_report_analysis(
         "summary": summary,
         "created_at": now,
     }
-    result = await asyncio.to_thread(report_analysis_collection.insert_one, document)
+    result = await report_analysis_collection.insert_one(document)
     document["_id"] = result.inserted_id
     return ReportAnalysisRecord(**document)
 
 
 async def list_report_analysis(limit: int = 20) -> List[ReportAnalysisRecord]:
-    def _fetch():
-        cursor = report_analysis_collection.find().sort("created_at", -1).limit(limit)
-        return list(cursor)
-
-    docs = await asyncio.to_thread(_fetch)
+    cursor = (
+        report_analysis_collection.find(projection=_REPORT_ANALYSIS_PROJECTION)
+        .sort("created_at", -1)
+        .limit(limit)
+    )
     normalized = []
-    for doc in docs:
+    async for doc in cursor:
         if "parameters" in doc and doc["parameters"] is not None:
             doc["parameters"] = _normalize_parameters(doc["parameters"])
         if "evaluation" in doc and doc["evaluation"] is not None:
@@ -165,10 +177,7 @@ async def list_report_analysis(limit: int = 20) -> List[ReportAnalysisRecord]:
 async def get_financial_analysis_by_file_id(
     file_id: str,
 ) -> Optional[FinancialAnalysisRecord]:
-    def _fetch():
-        return financial_analysis_collection.find_one({"file_id": file_id})
-
-    doc = await asyncio.to_thread(_fetch)
+    doc = await financial_analysis_collection.find_one({"file_id": file_id})
     if not doc:
         return None
     if "parameters" in doc and doc["parameters"] is not None:
@@ -209,14 +218,11 @@ async def save_financial_analysis(
         "status": status,
         "updated_at": now,
     }
-    await asyncio.to_thread(
-        financial_analysis_collection.update_one,
+    stored = await financial_analysis_collection.find_one_and_update(
         {"file_id": file_id},
         {"$set": document, "$setOnInsert": {"created_at": now}},
         upsert=True,
-    )
-    stored = await asyncio.to_thread(
-        financial_analysis_collection.find_one, {"file_id": file_id}
+        return_document=ReturnDocument.AFTER,
     )
     if not stored:
         raise RuntimeError("Financial analysis record missing after upsert")
@@ -224,15 +230,13 @@ async def save_financial_analysis(
 
 
 async def list_financial_analysis(limit: int = 20) -> List[FinancialAnalysisRecord]:
-    def _fetch():
-        cursor = (
-            financial_analysis_collection.find().sort("created_at", -1).limit(limit)
-        )
-        return list(cursor)
-
-    docs = await asyncio.to_thread(_fetch)
+    cursor = (
+        financial_analysis_collection.find(projection=_FINANCIAL_ANALYSIS_PROJECTION)
+        .sort("created_at", -1)
+        .limit(limit)
+    )
     normalized = []
-    for doc in docs:
+    async for doc in cursor:
         if "parameters" in doc and doc["parameters"] is not None:
             doc["parameters"] = _normalize_parameters(doc["parameters"])
         normalized.append(FinancialAnalysisRecord(**doc))
@@ -240,22 +244,19 @@ async def list_financial_analysis(limit: int = 20) -> List[FinancialAnalysisReco
 
 
 async def get_watchlist(user_id: PyObjectId) -> WatchlistRecord:
-    def _fetch():
-        return watchlists_collection.find_one({"user_id": ObjectId(user_id)})
-
-    doc = await asyncio.to_thread(_fetch)
+    doc = await watchlists_collection.find_one({"user_id": ObjectId(user_id)})
     if doc:
         return WatchlistRecord(**doc)
 
-    record = WatchlistRecord(user_id=user_id, symbols=[], updated_at=datetime.utcnow())
-    await asyncio.to_thread(
-        watchlists_collection.update_one,
+    now = datetime.utcnow()
+    record = WatchlistRecord(user_id=user_id, symbols=[], updated_at=now)
+    await watchlists_collection.update_one(
         {"user_id": ObjectId(user_id)},
         {
             "$setOnInsert": {
                 "user_id": ObjectId(user_id),
                 "symbols": [],
-                "updated_at": datetime.utcnow(),
+                "updated_at": now,
             }
         },
         upsert=True,
@@ -264,10 +265,9 @@ async def get_watchlist(user_id: PyObjectId) -> WatchlistRecord:
 
 
 async def update_watchlist(user_id: PyObjectId, symbols: List[str]) -> WatchlistRecord:
-    cleaned = sorted(set(symbol.upper() for symbol in symbols if symbol))
+    cleaned = _clean_symbols(symbols)
     now = datetime.utcnow()
-    await asyncio.to_thread(
-        watchlists_collection.update_one,
+    doc = await watchlists_collection.find_one_and_update(
         {"user_id": ObjectId(user_id)},
         {
             "$set": {
@@ -277,15 +277,51 @@ async def update_watchlist(user_id: PyObjectId, symbols: List[str]) -> Watchlist
             "$setOnInsert": {"created_at": now},
         },
         upsert=True,
-    )
-    doc = await asyncio.to_thread(
-        watchlists_collection.find_one, {"user_id": ObjectId(user_id)}
+        return_document=ReturnDocument.AFTER,
     )
     if not doc:
         return WatchlistRecord(user_id=user_id, symbols=cleaned, updated_at=now)
     return WatchlistRecord(**doc)
 
 
+def _clean_symbols(symbols: Iterable[str]) -> List[str]:
+    return sorted(set(symbol.upper() for symbol in symbols if symbol))
+
+
+async def add_watchlist_symbols(
+    user_id: PyObjectId, symbols: List[str]
+) -> WatchlistRecord:
+    now = datetime.utcnow()
+    doc = await watchlists_collection.find_one_and_update(
+        {"user_id": ObjectId(user_id)},
+        {
+            "$addToSet": {"symbols": {"$each": _clean_symbols(symbols)}},
+            "$set": {"updated_at": now},
+            "$setOnInsert": {"created_at": now},
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    return WatchlistRecord(**doc)
+
+
+async def remove_watchlist_symbols(
+    user_id: PyObjectId, symbols: List[str]
+) -> WatchlistRecord:
+    now = datetime.utcnow()
+    doc = await watchlists_collection.find_one_and_update(
+        {"user_id": ObjectId(user_id)},
+        {
+            "$pullAll": {"symbols": _clean_symbols(symbols)},
+            "$set": {"updated_at": now},
+            "$setOnInsert": {"created_at": now},
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    return WatchlistRecord(**doc)
+
+
 async def add_favorite_article(
     user_id: PyObjectId, article_id: str
 ) -> FavoriteArticleRecord:
@@ -294,15 +330,14 @@ async def add_favorite_article(
     except Exception as exc:  # pragma: no cover - invalid id
         raise ValueError("Invalid article id") from exc
 
-    existing_article = await asyncio.to_thread(
-        articles_collection.find_one, {"_id": article_oid}
+    existing_article = await articles_collection.find_one(
+        {"_id": article_oid}, projection={"_id": 1}
     )
     if not existing_article:
         raise ValueError("Article not found")
 
     now = datetime.utcnow()
-    await asyncio.to_thread(
-        favorite_articles_collection.update_one,
+    doc = await favorite_articles_collection.find_one_and_update(
         {"user_id": ObjectId(user_id), "article_id": article_oid},
         {
             "$set": {
@@ -312,10 +347,7 @@ async def add_favorite_article(
             }
         },
         upsert=True,
-    )
-    doc = await asyncio.to_thread(
-        favorite_articles_collection.find_one,
-        {"user_id": ObjectId(user_id), "article_id": article_oid},
+        return_document=ReturnDocument.AFTER,
     )
     if not doc:
         raise RuntimeError("Failed to load favorite record")
@@ -328,25 +360,27 @@ async def remove_favorite_article(user_id: PyObjectId, article_id: str) -> None:
     except Exception as exc:  # pragma: no cover
         raise ValueError("Invalid article id") from exc
 
-    await asyncio.to_thread(
-        favorite_articles_collection.delete_one,
+    await favorite_articles_collection.delete_one(
         {"user_id": ObjectId(user_id), "article_id": article_oid},
     )
 
 
 async def list_favorite_articles(user_id: PyObjectId) -> List[ArticleInDB]:
-    def _favorite_ids():
-        cursor = favorite_articles_collection.find({"user_id": ObjectId(user_id)})
-        return [doc["article_id"] for doc in cursor]
-
-    article_ids = await asyncio.to_thread(_favorite_ids)
-    if not article_ids:
-        return []
-
-    def _fetch_articles():
-        cursor = articles_collection.find({"_id": {"$in": article_ids}})
-        return list(cursor)
-
-    docs = await asyncio.to_thread(_fetch_articles)
-    docs.sort(key=lambda doc: doc.get("created_at"), reverse=True)
-    return [ArticleInDB(**doc) for doc in docs]
+    pipeline = [
+        {"$match": {"user_id": ObjectId(user_id)}},
+        {"$sort": {"created_at": -1}},
+        {"$project": {"_id": 0, "article_id": 1}},
+        {
+            "$lookup": {
+                "from": articles_collection.name,
+                "localField": "article_id",
+                "foreignField": "_id",
+                "as": "article",
+            }
+        },
+        {"$unwind": "$article"},
+        {"$replaceRoot": {"newRoot": "$article"}},
+        {"$project": _ARTICLE_PROJECTION},
+    ]
+    cursor = favorite_articles_collection.aggregate(pipeline)
+    return [ArticleInDB(**doc) async for doc in cursor]
@@ -1,7 +1,12 @@
 import os
 
 from dotenv import load_dotenv
-from pymongo import ASCENDING, DESCENDING, MongoClient
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
+from pymongo import ASCENDING, DESCENDING, IndexModel, MongoClient
 from pymongo.collection import Collection
 from pymongo.database import Database
 
@@ -13,6 +18,11 @@ DATABASE_NAME = os.getenv("DATABASE_NAME", "stock_broker_assistant")
 client: MongoClient = MongoClient(MONGODB_URL)
 database: Database = client[DATABASE_NAME]
 
+# Native asyncio driver for request handlers that would otherwise hop onto a
+# worker thread per query.
+async_client: AsyncIOMotorClient = AsyncIOMotorClient(MONGODB_URL, maxPoolSize=50)
+async_database: AsyncIOMotorDatabase = async_client[DATABASE_NAME]
+
 
 def get_collection(name: str) -> Collection:
     """Return a typed collection handle."""
@@ -20,6 +30,12 @@ def get_collection(name: str) -> Collection:
     return database.get_collection(name)
 
 
+def get_async_collection(name: str) -> AsyncIOMotorCollection:
+    """Return an asyncio (motor) collection handle."""
+
+    return async_database.get_collection(name)
+
+
 users_collection: Collection = get_collection("users")
 articles_collection: Collection = get_collection("articles")
 report_analysis_collection: Collection = get_collection("report_analysis")
@@ -31,82 +47,98 @@ admin_logs_collection: Collection = get_collection("admin_logs")
 user_settings_collection: Collection = get_collection("user_settings")
 application_settings_collection: Collection = get_collection("application_settings")
 
-# Ensure useful indexes exist (no-op if already created)
-users_collection.create_index(
-    [("email", ASCENDING)],
-    unique=True,
-)
-users_collection.create_index(
-    [("username", ASCENDING)],
-    unique=True,
-)
-users_collection.create_index(
-    [("reset_token", ASCENDING)],
-    unique=True,
-    sparse=True,
-)
-
-articles_collection.create_index(
-    [("link", ASCENDING)],
-    unique=True,
-)
-articles_collection.create_index(
-    [("created_at", ASCENDING)],
-)
-
-report_analysis_collection.create_index(
-    [("created_at", ASCENDING)],
-)
-
-financial_analysis_collection.create_index(
-    [("created_at", ASCENDING)],
-)
-financial_analysis_collection.create_index(
-    [("file_id", ASCENDING)],
-    unique=True,
-)
-
-market_filings_collection.create_index(
-    [("source", ASCENDING), ("link", ASCENDING)],
-    unique=True,
-)
-market_filings_collection.create_index(
-    [("created_at", ASCENDING)],
-)
-
-watchlists_collection.create_index(
-    [("user_id", ASCENDING)],
-    unique=True,
-)
-
-favorite_articles_collection.create_index(
-    [("user_id", ASCENDING), ("article_id", ASCENDING)],
-    unique=True,
-)
-favorite_articles_collection.create_index(
-    [("created_at", ASCENDING)],
-)
-
-admin_logs_collection.create_index(
-    [
-        ("created_at", DESCENDING),
-    ]
-)
-admin_logs_collection.create_index(
-    [
-        ("level", ASCENDING),
-        ("created_at", DESCENDING),
-    ]
-)
-
-user_settings_collection.create_index(
-    [
-        ("user_id", ASCENDING),
-    ],
-    unique=True,
-)
-user_settings_collection.create_index(
-    [
-        ("updated_at", DESCENDING),
-    ]
-)
+async_articles_collection: AsyncIOMotorCollection = get_async_collection("articles")
+async_report_analysis_collection: AsyncIOMotorCollection = get_async_collection(
+    "report_analysis"
+)
+async_financial_analysis_collection: AsyncIOMotorCollection = get_async_collection(
+    "financial_analysis"
+)
+async_market_filings_collection: AsyncIOMotorCollection = get_async_collection(
+    "market_filings"
+)
+async_watchlists_collection: AsyncIOMotorCollection = get_async_collection("watchlists")
+async_favorite_articles_collection: AsyncIOMotorCollection = get_async_collection(
+    "favorite_articles"
+)
+
+
+# Set once ensure_indexes() has run, so repeat calls in the same process (e.g.
+# a second app startup under tests or reload) skip the createIndexes round-trips.
+_INDEXES_READY = False
+
+
+def ensure_indexes() -> None:
+    """Create the indexes backing the service-layer queries (no-op if present)."""
+
+    global _INDEXES_READY
+    if _INDEXES_READY:
+        return
+
+    users_collection.create_indexes(
+        [
+            IndexModel([("email", ASCENDING)], unique=True),
+            IndexModel([("username", ASCENDING)], unique=True),
+            IndexModel([("reset_token", ASCENDING)], unique=True, sparse=True),
+            IndexModel([("is_active", ASCENDING)]),
+            IndexModel([("created_at", DESCENDING)]),
+        ]
+    )
+
+    articles_collection.create_indexes(
+        [
+            IndexModel([("link", ASCENDING)], unique=True),
+            IndexModel([("created_at", ASCENDING)]),
+        ]
+    )
+
+    report_analysis_collection.create_indexes(
+        [
+            IndexModel([("created_at", ASCENDING)]),
+        ]
+    )
+
+    financial_analysis_collection.create_indexes(
+        [
+            IndexModel([("created_at", ASCENDING)]),
+            IndexModel([("file_id", ASCENDING)], unique=True),
+        ]
+    )
+
+    market_filings_collection.create_indexes(
+        [
+            IndexModel([("source", ASCENDING), ("link", ASCENDING)], unique=True),
+            IndexModel([("created_at", ASCENDING)]),
+        ]
+    )
+
+    watchlists_collection.create_indexes(
+        [
+            IndexModel([("user_id", ASCENDING)], unique=True),
+        ]
+    )
+
+    favorite_articles_collection.create_indexes(
+        [
+            IndexModel(
+                [("user_id", ASCENDING), ("article_id", ASCENDING)], unique=True
+            ),
+            IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)]),
+        ]
+    )
+
+    admin_logs_collection.create_indexes(
+        [
+            IndexModel([("created_at", DESCENDING)]),
+            IndexModel([("level", ASCENDING), ("created_at", DESCENDING)]),
+        ]
+    )
+
+    user_settings_collection.create_indexes(
+        [
+            IndexModel([("user_id", ASCENDING)], unique=True),
+            IndexModel([("updated_at", DESCENDING)]),
+        ]
+    )
+
+    _INDEXES_READY = True
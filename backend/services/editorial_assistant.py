@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
-import json
 import re
+from functools import lru_cache
 from typing import Sequence
 
+import orjson
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
 
 load_dotenv()
 
-_client = genai.Client()
+
+@lru_cache(maxsize=1)
+def _get_client() -> genai.Client:
+    """Create the GenAI client on first use rather than at import time."""
+    return genai.Client()
+
+
+# Matches a leading ```/```json fence or a trailing ``` fence
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
 
 _DEFAULT_STRUCTURE = {
     "headline": "",
@@ -29,7 +38,7 @@ def _strip_code_fences(payload: str) -> str:
     """Remove markdown code fences if the model wraps JSON output."""
     if payload.startswith("```"):
         # Tolerate both ```json and ``` fences
-        return re.sub(r"^```(?:json)?\s*|\s*```$", "", payload).strip()
+        return _FENCE_RE.sub("", payload).strip()
     return payload
 
 
@@ -86,7 +95,7 @@ def generate_editorial_article(
     Ensure figures tie back to the provided inputs or flag when assumptions are made.
     """
 
-    response = _client.models.generate_content(
+    response = _get_client().models.generate_content(
         model="gemini-2.5-flash",
         config=types.GenerateContentConfig(
             temperature=0.25,
@@ -105,8 +114,8 @@ def generate_editorial_article(
         raise ValueError("No content returned from editorial generation model.")
 
     try:
-        payload = json.loads(text)
-    except json.JSONDecodeError as exc:
+        payload = orjson.loads(text)
+    except orjson.JSONDecodeError as exc:
         raise ValueError("Model response was not valid JSON.") from exc
 
     result: dict[str, object] = {}
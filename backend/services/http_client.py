@@ -0,0 +1,202 @@
+"""Outbound HTTP helpers shared by the public market-data fetchers.
+
+Yahoo, SEC and SEBI all rate-limit anonymous clients. Every request made
+through ``throttled_get`` is capped per host (concurrent connections and a
+token-bucket request rate) and retried with exponential back-off when the
+host answers 429/503, honouring ``Retry-After`` when it is sent.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional, TypeVar
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MAX_REQUESTS_PER_HOST = 8
+MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 0.5
+MAX_BACKOFF_SECONDS = 30.0
+RETRY_STATUSES = frozenset({429, 503})
+
+# (requests per second, burst capacity) per host. SEC's fair-access policy
+# allows 10 req/s; SEBI is a small government site, so go gently.
+HOST_RATE_LIMITS: dict[str, tuple[float, int]] = {
+    "query1.finance.yahoo.com": (10.0, 30),
+    "query2.finance.yahoo.com": (10.0, 30),
+    "www.sec.gov": (8.0, 8),
+    "www.sebi.gov.in": (2.0, 4),
+}
+DEFAULT_RATE_LIMIT: tuple[float, int] = (10.0, 10)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket that can also be paused host-wide."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                else:
+                    elapsed = now - self._updated
+                    self._tokens = min(
+                        self.capacity, self._tokens + elapsed * self.rate
+                    )
+                    self._updated = now
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+# One pooled, keep-alive session for every fetcher, so repeat calls to the same
+# host skip the TCP + TLS handshake. urllib3 retries connection errors and 5xx
+# gateway blips; 429/503 are left to throttled_get so back-off is host-wide.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 504),
+        raise_on_status=False,
+    ),
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+_host_limits: dict[str, tuple[threading.BoundedSemaphore, _TokenBucket]] = {}
+_host_limits_lock = threading.Lock()
+
+
+def _limits_for(host: str) -> tuple[threading.BoundedSemaphore, _TokenBucket]:
+    with _host_limits_lock:
+        limits = _host_limits.get(host)
+        if limits is None:
+            rate, capacity = HOST_RATE_LIMITS.get(host, DEFAULT_RATE_LIMIT)
+            limits = (
+                threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST),
+                _TokenBucket(rate, capacity),
+            )
+            _host_limits[host] = limits
+        return limits
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def throttled_get(url: str, **kwargs) -> requests.Response:
+    """``requests.get`` over a pooled session with per-host throttling and 429/503 back-off.
+
+    The last response is returned as-is once retries are exhausted, so callers
+    keep their existing status handling.
+    """
+    slot, bucket = _limits_for(urlparse(url).netloc)
+
+    for attempt in range(MAX_RETRIES + 1):
+        bucket.acquire()
+        with slot:
+            response = _session.get(url, **kwargs)
+
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            break
+
+        backoff = BACKOFF_BASE_SECONDS * 2**attempt
+        delay = min(
+            MAX_BACKOFF_SECONDS, max(backoff, _retry_after_seconds(response) or 0.0)
+        )
+        logger.debug(
+            "%s returned %s; retrying in %.1fs", url, response.status_code, delay
+        )
+        # Back off every caller hitting this host, not just this one.
+        bucket.pause(delay)
+
+    return response
+
+
+class ConditionalFeed:
+    """Revalidating cache for one feed URL fetched through ``throttled_get``.
+
+    The ``ETag`` / ``Last-Modified`` of the last 200 are sent back as
+    ``If-None-Match`` / ``If-Modified-Since``. On ``304 Not Modified`` the stored
+    body is reused, along with anything already parsed from it for the same
+    ``count``, so unchanged feeds cost neither the transfer nor the parse.
+    """
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self._validators: dict[str, str] = {}
+        self._body: Optional[bytes] = None
+        self._parsed: dict[int, object] = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, parse: Callable[[bytes, int], T], count: int, **kwargs) -> T:
+        """Return ``parse(body, count)`` for the current feed body.
+
+        Raises ``requests.HTTPError`` for 4xx/5xx answers, like ``raise_for_status``.
+        """
+        with self._lock:
+            validators = dict(self._validators)
+        headers = {**(kwargs.pop("headers", None) or {}), **validators}
+        response = throttled_get(self.url, headers=headers, **kwargs)
+
+        with self._lock:
+            if response.status_code == 304 and self._body is not None:
+                body = self._body
+                if count in self._parsed:
+                    return self._parsed[count]  # type: ignore[return-value]
+            else:
+                response.raise_for_status()
+                body = response.content
+                self._body = body
+                self._parsed.clear()
+                self._validators = {}
+                if etag := response.headers.get("ETag"):
+                    self._validators["If-None-Match"] = etag
+                if last_modified := response.headers.get("Last-Modified"):
+                    self._validators["If-Modified-Since"] = last_modified
+
+        result = parse(body, count)
+        with self._lock:
+            # Skip storing if a newer body landed while this one was parsed.
+            if self._body is body:
+                self._parsed[count] = result
+        return result
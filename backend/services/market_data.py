@@ -7,13 +7,33 @@ routes can still respond even when a specific fetch fails.
 
 from __future__ import annotations
 
+import contextvars
+import functools
+import heapq
 import logging
-from datetime import date, datetime, timedelta
-from typing import Iterable, Optional, Sequence, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import quote
 
-import pandas as pd
+import numpy as np
+import orjson
 import requests
-import yfinance as yf
+
+from services.http_client import throttled_get
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +87,14 @@ INDIA_LIQUID_TICKERS: dict[str, dict[str, str]] = {
     "ASIANPAINT.NS": {"name": "Asian Paints", "region": "IN"},
 }
 
+# Movers universe flattened once at import: (symbol, name, region).
+_UNIVERSE_ITEMS: tuple[tuple[str, str, str], ...] = tuple(
+    (symbol, meta["name"], meta["region"])
+    for symbol, meta in {**US_LIQUID_TICKERS, **INDIA_LIQUID_TICKERS}.items()
+)
+_UNIVERSE_SYMBOLS: tuple[str, ...] = tuple(symbol for symbol, _, _ in _UNIVERSE_ITEMS)
+
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
 YAHOO_SCREENER_URL = (
     "https://query1.finance.yahoo.com/v1/finance/screener/predefined/saved"
 )
@@ -83,33 +111,206 @@ NEWS_SYMBOLS: dict[str, str] = {
     "^BSESN": "IN",
 }
 
+# Each symbol is a separate blocking Yahoo round-trip, so fan them out instead of
+# paying for them one after another.
+MAX_FETCH_WORKERS = 8
+
+_fetch_pool = ThreadPoolExecutor(
+    max_workers=MAX_FETCH_WORKERS, thread_name_prefix="market-data"
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _pool_map(func: Callable[[T], R], items: Iterable[T]) -> list[R]:
+    """``_fetch_pool.map`` that runs each call in a copy of the caller's context.
+
+    Keeps ``refreshing_market_data_cache`` in effect inside the worker threads.
+    """
+    futures = [
+        _fetch_pool.submit(contextvars.copy_context().run, func, item) for item in items
+    ]
+    return [future.result() for future in futures]
+
+
+History = dict[str, list]
+Rows = Tuple[dict, Optional[dict]]
+
+# Quotes only move at tick cadence, so repeat dashboard calls within a few
+# seconds can share one fetch. Closed trading days never change.
+LIVE_CACHE_TTL_SECONDS = 30.0
+HISTORICAL_CACHE_TTL_SECONDS = 24 * 60 * 60.0
+CACHE_MAX_ENTRIES = 512
+
+_cache: dict[Hashable, Tuple[float, Any]] = {}
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+# Set while the prefetcher runs: lookups are skipped so entries are refetched
+# and replaced before they expire instead of being served back to it.
+_refreshing: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "market_data_refreshing", default=False
+)
+
+
+@contextmanager
+def refreshing_market_data_cache() -> Iterator[None]:
+    """Within this block, cached fetchers always refetch and overwrite their entry."""
+    token = _refreshing.set(True)
+    try:
+        yield
+    finally:
+        _refreshing.reset(token)
+
+
+def _ttl_cached(ttl: Callable[..., float]):
+    """Memoize a fetcher by its positional arguments for ``ttl(*args)`` seconds.
+
+    Empty results are not cached, since they usually mean the fetch failed.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = (func.__name__, *args)
+            now = time.monotonic()
+            if not _refreshing.get():
+                with _cache_lock:
+                    entry = _cache.get(key)
+                    hit = entry is not None and entry[0] > now
+                    _cache_stats["hits" if hit else "misses"] += 1
+                if hit:
+                    return entry[1]
 
-def _fetch_history(symbol: str, target: Optional[date]) -> pd.DataFrame:
-    ticker = yf.Ticker(symbol)
+            value = func(*args)
+            if value:
+                with _cache_lock:
+                    if len(_cache) >= CACHE_MAX_ENTRIES:
+                        _evict(now)
+                    _cache[key] = (now + ttl(*args), value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def _evict(now: float) -> None:
+    expired = [key for key, (expires, _) in _cache.items() if expires <= now]
+    for key in expired:
+        del _cache[key]
+    while len(_cache) >= CACHE_MAX_ENTRIES:
+        del _cache[next(iter(_cache))]
+
+
+def clear_market_data_cache() -> int:
+    """Drop every cached quote, screener and news result; return how many."""
+    with _cache_lock:
+        cleared = len(_cache)
+        _cache.clear()
+    return cleared
+
+
+def get_market_data_cache_stats() -> dict[str, int]:
+    """Hit/miss counters and current size of the market data cache."""
+    with _cache_lock:
+        return {**_cache_stats, "entries": len(_cache)}
+
+
+def _history_ttl(symbol: str, target: Optional[date]) -> float:
+    if target is not None and target < date.today():
+        return HISTORICAL_CACHE_TTL_SECONDS
+    return LIVE_CACHE_TTL_SECONDS
+
+
+def _live_ttl(*_args) -> float:
+    return LIVE_CACHE_TTL_SECONDS
+
+
+def _epoch(day: date) -> int:
+    return int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp())
+
+
+def _fetch_history(symbol: str, target: Optional[date]) -> History:
+    """Daily closes/volumes from Yahoo's chart API, oldest first.
+
+    Reads the two lists straight out of the JSON instead of building a
+    DataFrame through ``yf.Ticker.history`` only to keep its last two rows.
+    """
     if target:
-        start = target - timedelta(days=14)
-        end = target + timedelta(days=1)
-        history = ticker.history(start=start, end=end, interval="1d", auto_adjust=False)
-        history = history.loc[history.index.date <= target]  # type: ignore
+        params: dict[str, Any] = {
+            "period1": _epoch(target - timedelta(days=14)),
+            "period2": _epoch(target + timedelta(days=1)),
+            "interval": "1d",
+        }
     else:
-        history = ticker.history(period="5d", interval="1d", auto_adjust=False)
+        params = {"range": "5d", "interval": "1d"}
+
+    response = throttled_get(
+        YAHOO_CHART_URL.format(symbol=quote(symbol, safe="")),
+        params=params,
+        headers=YAHOO_HEADERS,
+        timeout=10,
+    )
+    response.raise_for_status()
+
+    history: History = {"close": [], "volume": []}
+    result = (orjson.loads(response.content).get("chart") or {}).get("result") or []
+    if not result:
+        return history
+
+    chart = result[0]
+    quote_data = ((chart.get("indicators") or {}).get("quote") or [{}])[0]
+    # Timestamps mark the session open in UTC; shift to exchange time for dates
+    offset = (chart.get("meta") or {}).get("gmtoffset") or 0
+    for timestamp, close, volume in zip(
+        chart.get("timestamp") or [],
+        quote_data.get("close") or [],
+        quote_data.get("volume") or [],
+    ):
+        if close is None:
+            continue
+        if target:
+            day = datetime.fromtimestamp(timestamp + offset, timezone.utc).date()
+            if day > target:
+                continue
+        history["close"].append(close)
+        history["volume"].append(volume)
     return history
 
 
-def _extract_rows(history: pd.DataFrame) -> Optional[Tuple[dict, Optional[dict]]]:
-    if history.empty:
+def _extract_rows(history: History) -> Optional[Rows]:
+    closes, volumes = history["close"], history["volume"]
+    if not closes:
         return None
-    latest = history.iloc[-1].to_dict()
-    previous = history.iloc[-2].to_dict() if len(history) > 1 else None
+    latest = {"Close": closes[-1], "Volume": volumes[-1]}
+    previous = {"Close": closes[-2], "Volume": volumes[-2]} if len(closes) > 1 else None
     return latest, previous
 
 
+@_ttl_cached(_history_ttl)
+def _fetch_rows(symbol: str, target: Optional[date]) -> Optional[Rows]:
+    try:
+        return _extract_rows(_fetch_history(symbol, target))
+    except Exception as exc:  # pragma: no cover - network resiliency
+        logger.debug("Unable to fetch history for %s: %s", symbol, exc)
+        return None
+
+
+def _fetch_rows_batch(
+    symbols: Sequence[str], target: Optional[date]
+) -> dict[str, Optional[Rows]]:
+    """Fetch the latest two rows for every symbol concurrently."""
+    results = _pool_map(lambda symbol: _fetch_rows(symbol, target), symbols)
+    return dict(zip(symbols, results))
+
+
 def get_index_metrics(target: Optional[date] = None) -> list[dict]:
     metrics: list[dict] = []
+    rows_by_symbol = _fetch_rows_batch(list(INDEX_TICKERS.values()), target)
     for name, symbol in INDEX_TICKERS.items():
         try:
-            history = _fetch_history(symbol, target)
-            rows = _extract_rows(history)
+            rows = rows_by_symbol[symbol]
             if not rows:
                 continue
             latest, previous = rows
@@ -136,11 +337,13 @@ def get_index_metrics(target: Optional[date] = None) -> list[dict]:
 
 def get_sector_performance(target: Optional[date] = None) -> dict[str, dict]:
     summary: dict[str, dict] = {}
+    rows_by_symbol = _fetch_rows_batch(
+        [str(details.get("symbol")) for details in SECTOR_ETFS.values()], target
+    )
     for sector, details in SECTOR_ETFS.items():
         symbol = str(details.get("symbol"))
         try:
-            history = _fetch_history(symbol, target)
-            rows = _extract_rows(history)
+            rows = rows_by_symbol[symbol]
             if not rows:
                 continue
             latest, previous = rows
@@ -160,33 +363,7 @@ def get_sector_performance(target: Optional[date] = None) -> dict[str, dict]:
     return summary
 
 
-def _build_snapshot(
-    symbol: str,
-    name: str,
-    region: str,
-    target: Optional[date] = None,
-) -> Optional[dict]:
-    history = _fetch_history(symbol, target)
-    rows = _extract_rows(history)
-    if not rows:
-        return None
-    latest, previous = rows
-    price = float(latest.get("Close", 0.0))
-    if not price:
-        return None
-    prev_close = float(previous.get("Close", price)) if previous else price
-    change = price - prev_close
-    change_percent = (change / prev_close * 100) if prev_close else 0.0
-    return {
-        "symbol": symbol,
-        "name": name,
-        "price": round(price, 2),
-        "change": round(change, 2),
-        "change_percent": round(change_percent, 2),
-        "region": region,
-    }
-
-
+@_ttl_cached(_live_ttl)
 def _fetch_screener(scr_id: str, region: str, count: int) -> list[dict]:
     params = {
         "scrIds": scr_id,
@@ -195,7 +372,7 @@ def _fetch_screener(scr_id: str, region: str, count: int) -> list[dict]:
         "count": count,
     }
     try:
-        response = requests.get(
+        response = throttled_get(
             YAHOO_SCREENER_URL, params=params, headers=YAHOO_HEADERS, timeout=10
         )
         response.raise_for_status()
@@ -203,7 +380,7 @@ def _fetch_screener(scr_id: str, region: str, count: int) -> list[dict]:
         logger.debug("Yahoo screener fetch failed (%s, %s): %s", scr_id, region, exc)
         return []
 
-    data = response.json()
+    data = orjson.loads(response.content)
     result = data.get("finance", {}).get("result", []) or []
     if not result:
         return []
@@ -228,71 +405,129 @@ def _fetch_screener(scr_id: str, region: str, count: int) -> list[dict]:
 
 
 def _dedupe(symbols: Iterable[dict]) -> list[dict]:
-    seen: set[str] = set()
-    unique: list[dict] = []
+    """Drop repeated symbols, keeping each one's first occurrence in order."""
+    unique: dict[str, dict] = {}
     for item in symbols:
         symbol = item.get("symbol")
-        if not symbol or symbol in seen:
-            continue
-        seen.add(symbol)
-        unique.append(item)
-    return unique
+        if symbol:
+            unique.setdefault(symbol, item)
+    return list(unique.values())
 
 
 def get_market_movers(
     count: int = 6, target: Optional[date] = None
 ) -> tuple[list[dict], list[dict]]:
-    universe = {**US_LIQUID_TICKERS, **INDIA_LIQUID_TICKERS}
-    snapshots: list[dict] = []
-    for symbol, meta in universe.items():
-        try:
-            snapshot = _build_snapshot(
-                symbol=symbol,
-                name=meta.get("name", symbol),
-                region=meta.get("region", "US"),
-                target=target,
-            )
-            if snapshot:
-                snapshots.append(snapshot)
-        except Exception as exc:  # pragma: no cover - network resiliency
-            logger.debug("Unable to build mover snapshot for %s: %s", symbol, exc)
-
-    gainers = [item for item in snapshots if item.get("change_percent", 0) > 0]
-    losers = [item for item in snapshots if item.get("change_percent", 0) < 0]
-
-    gainers.sort(key=lambda item: item.get("change_percent", 0), reverse=True)
-    losers.sort(key=lambda item: item.get("change_percent", 0))
+    rows_by_symbol = _fetch_rows_batch(_UNIVERSE_SYMBOLS, target)
+
+    entries: list[tuple[str, str, str]] = []
+    prices: list[float] = []
+    prev_prices: list[float] = []
+    for entry in _UNIVERSE_ITEMS:
+        rows = rows_by_symbol[entry[0]]
+        if not rows:
+            continue
+        latest, previous = rows
+        price = latest.get("Close") or 0.0
+        if not price:
+            continue
+        entries.append(entry)
+        prices.append(price)
+        prev_prices.append(previous.get("Close", price) if previous else price)
+
+    # Snapshot math for the whole universe in one shot; only the rows that make
+    # the top `count` are turned into dicts.
+    closes = np.asarray(prices, dtype=float)
+    prev_closes = np.asarray(prev_prices, dtype=float)
+    changes = closes - prev_closes
+    change_percents = np.round(
+        np.divide(
+            changes * 100,
+            prev_closes,
+            out=np.zeros_like(changes),
+            where=prev_closes != 0,
+        ),
+        2,
+    )
+
+    def top(order: np.ndarray, mask: np.ndarray) -> list[dict]:
+        indices = np.flatnonzero(mask)
+        if len(indices) > count:
+            indices = indices[np.argpartition(order[indices], count)[:count]]
+        indices = indices[np.argsort(order[indices], kind="stable")]
+        return [
+            {
+                "symbol": entries[i][0],
+                "name": entries[i][1],
+                "price": round(float(closes[i]), 2),
+                "change": round(float(changes[i]), 2),
+                "change_percent": float(change_percents[i]),
+                "region": entries[i][2],
+            }
+            for i in indices
+        ]
 
-    top_gainers = gainers[:count]
-    top_losers = losers[:count]
+    top_gainers = top(-change_percents, change_percents > 0)
+    top_losers = top(change_percents, change_percents < 0)
 
-    # Fallback to Yahoo screener if curated universe does not yield enough movers
+    # Fallback to Yahoo screener if curated universe does not yield enough movers.
+    # Every screen needed is fetched at once rather than one region at a time.
+    screens: list[str] = []
     if len(top_gainers) < count:
-        fallback = _dedupe(
-            _fetch_screener("day_gainers", "US", count * 2)
-            + _fetch_screener("day_gainers", "IN", count * 2)
-        )
-        top_gainers = _dedupe(top_gainers + fallback)[:count]
+        screens.append("day_gainers")
     if len(top_losers) < count:
+        screens.append("day_losers")
+    screen_keys = [(scr_id, region) for scr_id in screens for region in ("US", "IN")]
+    screened = dict(
+        zip(
+            screen_keys,
+            _pool_map(
+                lambda screen: _fetch_screener(screen[0], screen[1], count * 2),
+                screen_keys,
+            ),
+        )
+    )
+
+    if "day_gainers" in screens:
         fallback = _dedupe(
-            _fetch_screener("day_losers", "US", count * 2)
-            + _fetch_screener("day_losers", "IN", count * 2)
+            screened["day_gainers", "US"] + screened["day_gainers", "IN"]
         )
+        top_gainers = _dedupe(top_gainers + fallback)[:count]
+    if "day_losers" in screens:
+        fallback = _dedupe(screened["day_losers", "US"] + screened["day_losers", "IN"])
         top_losers = _dedupe(top_losers + fallback)[:count]
 
     return top_gainers, top_losers
 
 
+@_ttl_cached(_live_ttl)
+def _fetch_news(symbol: str) -> list[dict]:
+    # yfinance (and the pandas stack it pulls in) is only needed for news, so
+    # import it on first use instead of at module load.
+    import yfinance as yf
+
+    try:
+        return yf.Ticker(symbol).news or []
+    except Exception as exc:  # pragma: no cover - network resiliency
+        logger.debug("Ticker news fetch failed (%s): %s", symbol, exc)
+        return []
+
+
+def _iso_utc(epoch: float) -> str:
+    """Format a Unix timestamp as a naive ISO-8601 UTC string."""
+    tm = time.gmtime(epoch)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+    )
+
+
 def get_market_news(count: int = 6) -> list[dict]:
-    stories: list[dict] = []
+    # (epoch, story) pairs; only the `count` stories kept get an ISO timestamp.
+    stories: list[tuple[float, dict]] = []
+    fetched_at = time.time()
     seen: set[str] = set()
-    for symbol, region in NEWS_SYMBOLS.items():
-        try:
-            news_items = yf.Ticker(symbol).news or []
-        except Exception as exc:  # pragma: no cover - network resiliency
-            logger.debug("Ticker news fetch failed (%s): %s", symbol, exc)
-            continue
-
+    news_by_symbol = _pool_map(_fetch_news, NEWS_SYMBOLS)
+    for (symbol, region), news_items in zip(NEWS_SYMBOLS.items(), news_by_symbol):
         for item in news_items:
             title = item.get("title")
             link = item.get("link")
@@ -304,34 +539,30 @@ def get_market_news(count: int = 6) -> list[dict]:
                 continue
             seen.add(uid)
             published = item.get("providerPublishTime")
-            timestamp = (
-                datetime.fromtimestamp(published).isoformat()
-                if isinstance(published, (int, float))
-                else datetime.utcnow().isoformat()
-            )
+            epoch = published if isinstance(published, (int, float)) else fetched_at
             stories.append(
-                {
-                    "title": title,
-                    "source": publisher,
-                    "link": link,
-                    "timestamp": timestamp,
-                    "region": region,
-                }
+                (
+                    epoch,
+                    {
+                        "title": title,
+                        "source": publisher,
+                        "link": link,
+                        "region": region,
+                    },
+                )
             )
 
-    stories.sort(key=lambda story: story.get("timestamp", ""), reverse=True)
-    return stories[:count]
+    latest = heapq.nlargest(count, stories, key=lambda story: story[0])
+    return [{**story, "timestamp": _iso_utc(epoch)} for epoch, story in latest]
 
 
 def get_watchlist_snapshot(symbols: Sequence[str]) -> list[dict]:
     snapshot: list[dict] = []
-    for raw_symbol in symbols:
-        symbol = raw_symbol.strip()
-        if not symbol:
-            continue
+    cleaned = [symbol for symbol in (raw.strip() for raw in symbols) if symbol]
+    rows_by_symbol = _fetch_rows_batch(cleaned, None)
+    for symbol in cleaned:
         try:
-            history = _fetch_history(symbol, None)
-            rows = _extract_rows(history)
+            rows = rows_by_symbol[symbol]
             if not rows:
                 continue
             latest, previous = rows
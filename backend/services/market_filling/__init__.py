@@ -3,7 +3,7 @@
 This module re-exports the primary fetch functions so callers can do:
         from market_filling import fetch_recent_sec_filings, fetch_recent_india_filings
 
-The implementations live in `us.py` and `india.py` and use requests + BeautifulSoup
+The implementations live in `us.py` and `india.py` and use requests + lxml
 only (no Selenium).
 """
 
@@ -1,69 +1,71 @@
-"""SEBI / India market filings fetcher using requests + BeautifulSoup.
+"""SEBI / India market filings fetcher using requests + lxml.
 
 This module provides a small, dependency-light scraper that parses the SEBI
 listing page and returns recent announcements/filings. It intentionally avoids
-Selenium and uses only `requests` + `bs4`.
+Selenium and uses only `requests` + `lxml`.
 """
 
 from __future__ import annotations
 
-from typing import List, Dict, Optional, cast
-import requests
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from functools import lru_cache
+from typing import List, Dict
+from lxml import html
+
+from services.http_client import ConditionalFeed
 
 
 SEBI_LISTING_URL = (
     "https://www.sebi.gov.in/sebiweb/home/HomeAction.do?doListing=yes&sid=3"
 )
 
+# `ul.news-list li` as XPath, so no cssselect dependency is needed
+NEWS_LIST_ITEMS_XPATH = (
+    "//ul[contains(concat(' ', normalize-space(@class), ' '), ' news-list ')]//li"
+)
+
+# Revalidate the listing instead of re-downloading it on every poll.
+_listing = ConditionalFeed(SEBI_LISTING_URL)
 
+
+@lru_cache(maxsize=2048)
 def _abs_sebi(href: str) -> str:
     if not href:
         return ""
-    if href.startswith("http"):
+    if href.startswith(("http://", "https://")):
         return href
     if href.startswith("/"):
         return "https://www.sebi.gov.in" + href
     return "https://www.sebi.gov.in/" + href
 
 
-def fetch_recent_india_filings(count: int = 10) -> List[Dict[str, str]]:
-    """Fetch recent filings/announcements from SEBI.
+def _text(element: html.HtmlElement) -> str:
+    """Element text with each fragment stripped, like bs4's get_text(strip=True)."""
+    return "".join(fragment.strip() for fragment in element.itertext())
 
-    Returns a list of dicts with keys: `company` (or `title`), `link`, `date` (if
-    available). Falls back between the announcements list and the `#sample_1`
-    table depending on page structure.
-    """
-    resp = requests.get(SEBI_LISTING_URL, timeout=10)
-    resp.raise_for_status()
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+def _parse_listing(content: bytes, count: int) -> List[Dict[str, str]]:
+    tree = html.fromstring(content)
 
     results: List[Dict[str, str]] = []
 
     # Primary source: table with id `sample_1` (if present)
-    table: Optional[Tag] = cast(Optional[Tag], soup.find("table", {"id": "sample_1"}))
-    if table:
-        tbody: Optional[Tag] = cast(Optional[Tag], table.find("tbody"))
-        if tbody:
-            rows = [cast(Tag, r) for r in tbody.find_all("tr")]
-            for row in rows[:count]:
-                cols = [cast(Tag, c) for c in row.find_all("td")]
+    tables = tree.xpath("//table[@id='sample_1']")
+    if tables:
+        tbody = tables[0].find("tbody")
+        if tbody is not None:
+            for row in tbody.xpath(".//tr")[:count]:
+                cols = row.xpath(".//td")
                 if not cols:
                     continue
-                date = cols[0].get_text(strip=True) if len(cols) >= 1 else ""
+                date = _text(cols[0])
 
                 # company / link typically in 2nd column
-                link_tag: Optional[Tag] = (
-                    cast(Optional[Tag], cols[1].find("a")) if len(cols) >= 2 else None
-                )
-                if link_tag is not None and isinstance(link_tag, Tag):
-                    company = link_tag.get_text(strip=True) or ""
-                    href = link_tag.get("href") or ""
-                    link = _abs_sebi(str(href))
+                link_tag = cols[1].find(".//a") if len(cols) >= 2 else None
+                if link_tag is not None:
+                    company = _text(link_tag)
+                    link = _abs_sebi(link_tag.get("href") or "")
                 else:
-                    company = cols[1].get_text(strip=True) if len(cols) >= 2 else ""
+                    company = _text(cols[1]) if len(cols) >= 2 else ""
                     link = ""
 
                 results.append({"company": company, "link": link, "date": date})
@@ -71,17 +73,26 @@ def fetch_recent_india_filings(count: int = 10) -> List[Dict[str, str]]:
             return results
 
     # Fallback: announcements list (ul.news-list li)
-    announcements = [cast(Tag, a) for a in soup.select("ul.news-list li")]
-    for ann in announcements[:count]:
-        title = ann.get_text(strip=True)
-        link_tag = cast(Optional[Tag], ann.find("a"))
+    for ann in tree.xpath(NEWS_LIST_ITEMS_XPATH)[:count]:
+        title = _text(ann)
+        link_tag = ann.find(".//a")
         href = link_tag.get("href") if link_tag is not None else ""
-        link = _abs_sebi(str(href)) if href else ""
+        link = _abs_sebi(href) if href else ""
         results.append({"title": title, "link": link})
 
     return results
 
 
+def fetch_recent_india_filings(count: int = 10) -> List[Dict[str, str]]:
+    """Fetch recent filings/announcements from SEBI.
+
+    Returns a list of dicts with keys: `company` (or `title`), `link`, `date` (if
+    available). Falls back between the announcements list and the `#sample_1`
+    table depending on page structure.
+    """
+    return list(_listing.fetch(_parse_listing, count, timeout=10))
+
+
 if __name__ == "__main__":
     from pprint import pprint
 
@@ -1,4 +1,4 @@
-"""SEC / US market filings fetcher using requests + BeautifulSoup.
+"""SEC / US market filings fetcher using requests + lxml.
 
 This is a compact reimplementation of the previous SEC feed reader. It
 fetches the SEC "current" feed (Atom) and returns a list of recent filings.
@@ -6,10 +6,13 @@ fetches the SEC "current" feed (Atom) and returns a list of recent filings.
 
 from __future__ import annotations
 
-from typing import List, Dict, Optional, cast
+from io import BytesIO
+from itertools import islice
+from typing import List, Dict
 import requests
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from lxml import etree
+
+from services.http_client import ConditionalFeed
 
 
 SEC_FEED_URL = (
@@ -21,48 +24,79 @@ SEC_HEADERS = {
     "Accept-Encoding": "gzip, deflate",
 }
 
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+ENTRY_TAGS = (ATOM_NS + "entry", "item")
 
-def fetch_recent_sec_filings(count: int = 10) -> List[Dict[str, str]]:
-    """Fetch recent filings from the SEC Atom feed.
+# The feed changes every few minutes at most; most polls come back 304.
+_feed = ConditionalFeed(SEC_FEED_URL)
 
-    Returns a list of dicts with `title` and `link` keys.
-    """
-    resp = requests.get(SEC_FEED_URL, headers=SEC_HEADERS, timeout=10)
-    if resp.status_code != 200:
-        # keep API simple: return empty list on error
-        return []
 
-    # Feed is XML (Atom). Use the xml parser for safety.
-    soup = BeautifulSoup(resp.content, "lxml-xml")
-    raw_entries = soup.find_all(["entry", "item"]) or []
+def _child(entry: etree._Element, name: str) -> etree._Element | None:
+    """Find an Atom child, falling back to the un-namespaced RSS tag."""
+    found = entry.find(ATOM_NS + name)
+    return found if found is not None else entry.find(name)
 
-    entries: List[Tag] = [cast(Tag, e) for e in raw_entries]
+
+def _parse_feed(content: bytes, count: int) -> List[Dict[str, str]]:
+    # Feed is XML (Atom); stream it and stop once `count` entries are read
+    # instead of building the whole tree. The feed is remote input: never
+    # expand entities or fetch external DTDs.
+    events = etree.iterparse(
+        BytesIO(content),
+        events=("end",),
+        tag=ENTRY_TAGS,
+        resolve_entities=False,
+        no_network=True,
+    )
     results: List[Dict[str, str]] = []
 
-    for entry in entries[:count]:
-        title_tag: Optional[Tag] = cast(Optional[Tag], entry.find("title"))
-        title = (
-            title_tag.get_text(strip=True)
-            if title_tag is not None and isinstance(title_tag, Tag)
-            else "No title"
-        )
-
-        # Atom feed uses <link href="..."/>, RSS may have <link>url</link>
-        link_tag: Optional[Tag] = cast(Optional[Tag], entry.find("link"))
-        link = ""
-        if link_tag is not None and isinstance(link_tag, Tag):
-            # prefer href attribute
-            href = link_tag.get("href")
-            if href:
-                link = str(href)
-            elif link_tag.string:
-                link = link_tag.get_text(strip=True)
-
-        results.append({"title": title, "link": link})
+    try:
+        for _, entry in islice(events, count):
+            title_el = _child(entry, "title")
+            title = (
+                "".join(title_el.itertext()).strip()
+                if title_el is not None
+                else "No title"
+            )
+
+            # Atom feed uses <link href="..."/>, RSS may have <link>url</link>
+            link_el = _child(entry, "link")
+            link = ""
+            if link_el is not None:
+                # prefer href attribute
+                href = link_el.get("href")
+                if href:
+                    link = href
+                elif link_el.text:
+                    link = link_el.text.strip()
+
+            results.append({"title": title, "link": link})
+
+            # Free the parsed entry and any siblings already handled.
+            entry.clear()
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+    except etree.XMLSyntaxError:
+        # Truncated or malformed feed: keep the entries that parsed cleanly, as
+        # the lenient BeautifulSoup reader did, rather than failing the request.
+        pass
 
     return results
 
 
+def fetch_recent_sec_filings(count: int = 10) -> List[Dict[str, str]]:
+    """Fetch recent filings from the SEC Atom feed.
+
+    Returns a list of dicts with `title` and `link` keys.
+    """
+    try:
+        results = _feed.fetch(_parse_feed, count, headers=SEC_HEADERS, timeout=10)
+    except requests.HTTPError:
+        # keep API simple: return empty list on error
+        return []
+    return list(results)
+
+
 if __name__ == "__main__":
     from pprint import pprint
 
@@ -0,0 +1,117 @@
+"""Background warm-up of the market dashboard data.
+
+The market-summary endpoints serve the same Yahoo data to every user. While
+a market we cover is open, refresh it on a fixed interval so user requests
+are answered from the market data TTL cache instead of waiting on Yahoo.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import datetime, time, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from services.market_data import (
+    LIVE_CACHE_TTL_SECONDS,
+    get_index_metrics,
+    get_market_data_cache_stats,
+    get_market_movers,
+    get_market_news,
+    get_sector_performance,
+    refreshing_market_data_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+# Runs start this far apart (measured start to start), so each refresh lands
+# while the entries written by the previous one are still live.
+PREFETCH_INTERVAL_SECONDS = LIVE_CACHE_TTL_SECONDS * 0.75
+
+# (timezone, open, close) of the regular sessions the dashboards cover.
+MARKET_SESSIONS: tuple[tuple[ZoneInfo, time, time], ...] = (
+    (ZoneInfo("America/New_York"), time(9, 30), time(16, 0)),
+    (ZoneInfo("Asia/Kolkata"), time(9, 15), time(15, 30)),
+)
+
+_prefetcher: Optional[asyncio.Task] = None
+_runs = 0
+_failures = 0
+_last_run: Optional[datetime] = None
+
+
+def is_market_open(now: Optional[datetime] = None) -> bool:
+    """True while a US or Indian regular session is open (holidays ignored)."""
+    now = now or datetime.now(timezone.utc)
+    for zone, opens, closes in MARKET_SESSIONS:
+        local = now.astimezone(zone)
+        if local.weekday() < 5 and opens <= local.time() <= closes:
+            return True
+    return False
+
+
+async def _prefetch_once() -> None:
+    global _runs, _failures, _last_run
+    # to_thread copies the current context, so the refresh flag reaches the fetchers
+    with refreshing_market_data_cache():
+        results = await asyncio.gather(
+            asyncio.to_thread(get_index_metrics),
+            asyncio.to_thread(get_sector_performance),
+            asyncio.to_thread(get_market_movers),
+            asyncio.to_thread(get_market_news),
+            return_exceptions=True,
+        )
+    _runs += 1
+    _last_run = datetime.now(timezone.utc)
+    for result in results:
+        if isinstance(result, Exception):
+            _failures += 1
+            logger.debug("Market data prefetch failed", exc_info=result)
+
+
+async def _run_prefetcher() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        if is_market_open():
+            await _prefetch_once()
+        elapsed = loop.time() - started
+        await asyncio.sleep(max(0.0, PREFETCH_INTERVAL_SECONDS - elapsed))
+
+
+def start_prefetcher() -> None:
+    global _prefetcher
+    if _prefetcher is None or _prefetcher.done():
+        _prefetcher = asyncio.create_task(_run_prefetcher())
+
+
+async def stop_prefetcher() -> None:
+    global _prefetcher
+    if _prefetcher is None:
+        return
+    _prefetcher.cancel()
+    with suppress(asyncio.CancelledError):
+        await _prefetcher
+    _prefetcher = None
+
+
+def get_prefetch_stats() -> dict:
+    """Prefetch run counters alongside the cache hit/miss counts."""
+    return {
+        "running": _prefetcher is not None and not _prefetcher.done(),
+        "market_open": is_market_open(),
+        "runs": _runs,
+        "failures": _failures,
+        "last_run": _last_run.isoformat() if _last_run else None,
+        "cache": get_market_data_cache_stats(),
+    }
+
+
+__all__ = [
+    "get_prefetch_stats",
+    "is_market_open",
+    "start_prefetcher",
+    "stop_prefetcher",
+]
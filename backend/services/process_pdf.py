@@ -1,8 +1,12 @@
 import base64
+import io
+import multiprocessing
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from docx import Document  # type: ignore
@@ -17,6 +21,11 @@ except ImportError:  # pragma: no cover - fallback when pymupdf/fitz not availab
     except ImportError:  # pragma: no cover - ultimate fallback
         import pymupdf4llm as fitz  # type: ignore
 
+try:
+    import pymupdf4llm  # type: ignore
+except ImportError:  # pragma: no cover - fall back to the span walker below
+    pymupdf4llm = None  # type: ignore
+
 if not hasattr(fitz, "open"):
     if hasattr(fitz, "Document"):
 
@@ -41,12 +50,31 @@ Creates simple heading detection via font-size heuristics, preserves basic
 inline bold/italic from font names, detects bullets, and can extract images.
 """
 
+# Below this many pages the worker start-up costs more than it saves.
+PDF_PARALLEL_MIN_PAGES = 32
+PDF_LAYOUT_MAX_WORKERS = 4
+
+_BULLET_RE = re.compile(r"^[\-\u2022\u2023\u25E6\u2043*o]\s+")
+# "", "# ", "## ", ... "###### ", indexed by heading level
+_HEADING_PREFIX = tuple("#" * level + " " if level else "" for level in range(7))
+_HEADING_DIGIT_RE = re.compile(r"\d+")
+_SANITIZE_TABLE = str.maketrans({"\r": None, "\t": "    "})
+_BOLD_FONT_RE = re.compile(r"bold|black", re.IGNORECASE)
+_ITALIC_FONT_RE = re.compile(r"italic|oblique", re.IGNORECASE)
+
 
 def _sanitize_md(text: str) -> str:
     # minimal escaping for Markdown-sensitive characters at line starts
-    text = text.replace("\r", "")
-    text = re.sub(r"\t", "    ", text)
-    return text
+    return text.translate(_SANITIZE_TABLE)
+
+
+@lru_cache(maxsize=256)
+def _font_flags(fontname: str) -> Tuple[bool, bool]:
+    """(is_bold, is_italic) for a font name; a PDF only uses a handful of fonts."""
+    return (
+        _BOLD_FONT_RE.search(fontname) is not None,
+        _ITALIC_FONT_RE.search(fontname) is not None,
+    )
 
 
 def _wrap_emphasis(text: str, is_bold: bool, is_italic: bool) -> str:
@@ -62,29 +90,134 @@ def _wrap_emphasis(text: str, is_bold: bool, is_italic: bool) -> str:
 
 
 def convert_pdf_to_md(
-    pdf_path: str, images_dir: Optional[str] = None, include_images: bool = True
+    pdf_path: str,
+    images_dir: Optional[str] = None,
+    include_images: bool = True,
+    embed_images: bool = False,
 ) -> str:
     """
     Convert a PDF to a Markdown string.
 
+    Uses pymupdf4llm's ``to_markdown`` when it is installed, which does the
+    heading/emphasis/list detection inside PyMuPDF, and the font-size span
+    walker otherwise.
+
     Args:
         pdf_path: path to the PDF file.
         images_dir: directory where extracted images will be saved (if included).
         include_images: whether to extract and include images in the Markdown.
+        embed_images: inline images as base64 data URIs instead of writing them
+            to disk. Without ``images_dir`` or this flag, images are dropped.
 
     Returns:
         Markdown text as a single string.
     """
+    # Images need somewhere to go: a caller-owned directory or inline data URIs.
+    include_images = include_images and bool(images_dir or embed_images)
+
+    if pymupdf4llm is not None and hasattr(pymupdf4llm, "to_markdown"):
+        if images_dir and include_images:
+            os.makedirs(images_dir, exist_ok=True)
+        markdown = pymupdf4llm.to_markdown(
+            pdf_path,
+            page_chunks=False,
+            write_images=bool(include_images and images_dir),
+            embed_images=bool(include_images and not images_dir),
+            ignore_images=not include_images,
+            image_path=images_dir or "",
+        )
+        return markdown.strip()
+
+    return _convert_pdf_spans(pdf_path, images_dir, include_images)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write ``data`` to ``path`` with raw os calls, skipping the buffered file object."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _page_blocks(
+    doc: Any, page_index: int, keep_images: bool = True
+) -> Optional[List[Any]]:
+    page_dict: Any = doc.load_page(page_index).get_text("dict")
+    blocks: Any = page_dict.get("blocks", []) if isinstance(page_dict, dict) else None
+    if not isinstance(blocks, list):
+        return None
+    if not keep_images:
+        # image blocks carry the decoded image bytes; don't hold them for nothing
+        blocks = [
+            block
+            for block in blocks
+            if not (isinstance(block, dict) and block.get("type") == 1)
+        ]
+    return blocks
+
+
+def _layout_pages(
+    pdf_path: str, start: int, stop: int, keep_images: bool = True
+) -> List[Optional[List[Any]]]:
+    """Worker: lay out pages ``start:stop`` from a private document handle."""
     doc: Any = fitz.open(pdf_path)  # type: ignore
     try:
+        return [
+            _page_blocks(doc, page_index, keep_images)
+            for page_index in range(start, stop)
+        ]
+    finally:
+        doc.close()
+
+
+def _layout_document(
+    doc: Any, pdf_path: str, keep_images: bool = True
+) -> List[Optional[List[Any]]]:
+    """Block lists for every page, laid out across processes for large PDFs.
+
+    PyMuPDF documents must not be shared between threads, so the pages are
+    split into contiguous ranges and each worker process opens its own handle.
+    """
+    total_pages = doc.page_count
+    workers = min(PDF_LAYOUT_MAX_WORKERS, os.cpu_count() or 1)
+    if total_pages < PDF_PARALLEL_MIN_PAGES or workers < 2:
+        return [
+            _page_blocks(doc, page_index, keep_images)
+            for page_index in range(total_pages)
+        ]
+
+    step = -(-total_pages // workers)
+    starts = range(0, total_pages, step)
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        chunks = pool.map(
+            _layout_pages,
+            [pdf_path] * len(starts),
+            starts,
+            [min(start + step, total_pages) for start in starts],
+            [keep_images] * len(starts),
+        )
+        return [blocks for chunk in chunks for blocks in chunk]
+
+
+def _convert_pdf_spans(
+    pdf_path: str, images_dir: Optional[str], include_images: bool
+) -> str:
+    """Hand-rolled PDF to Markdown conversion over ``page.get_text("dict")``."""
+    doc: Any = fitz.open(pdf_path)  # type: ignore
+    try:
+        # get_text("dict") is the expensive call, so each page is laid out once
+        # and its blocks are reused by the Markdown pass below.
+        page_blocks = _layout_document(doc, pdf_path, keep_images=include_images)
         sizes: Dict[float, int] = {}
-        for page_index in range(doc.page_count):
-            page: Any = doc.load_page(page_index)
-            page_dict: Any = page.get_text("dict")
-            if not isinstance(page_dict, dict):
-                continue
-            blocks: Any = page_dict.get("blocks", [])
-            if not isinstance(blocks, list):
+        # Font sizes repeat across thousands of spans: round each distinct one once.
+        rounded_sizes: Dict[float, float] = {}
+        for blocks in page_blocks:
+            if blocks is None:
                 continue
             for block in blocks:
                 if not isinstance(block, dict) or block.get("type") != 0:
@@ -99,7 +232,10 @@ def convert_pdf_to_md(
                     for span in spans:
                         if not isinstance(span, dict):
                             continue
-                        sz = round(float(span.get("size", 0) or 0), 2)
+                        raw_size = span.get("size", 0) or 0
+                        sz = rounded_sizes.get(raw_size)
+                        if sz is None:
+                            sz = rounded_sizes[raw_size] = round(float(raw_size), 2)
                         sizes[sz] = sizes.get(sz, 0) + 1
 
         unique_sizes = sorted(sizes.keys(), reverse=True)
@@ -107,16 +243,19 @@ def convert_pdf_to_md(
             sz: idx + 1 for idx, sz in enumerate(unique_sizes[:3])
         }
 
-        md_lines: List[str] = []
-        total_pages = doc.page_count
-        for page_number in range(total_pages):
-            page = doc.load_page(page_number)
-            page_dict = page.get_text("dict")
-            if not isinstance(page_dict, dict):
-                continue
-            blocks = page_dict.get("blocks", [])
-            if not isinstance(blocks, list):
+        if include_images and images_dir:
+            os.makedirs(images_dir, exist_ok=True)
+        # Logos and other repeated images share an xref: extract/write each once.
+        extracted: Dict[int, Any] = {}
+        written: Dict[int, str] = {}
+
+        out = io.StringIO()
+        total_pages = len(page_blocks)
+        for page_number, blocks in enumerate(page_blocks):
+            if blocks is None:
                 continue
+            # drop the cached layout as soon as the page is emitted
+            page_blocks[page_number] = None
 
             for block in blocks:
                 if not isinstance(block, dict):
@@ -131,48 +270,40 @@ def convert_pdf_to_md(
                         if not isinstance(spans, list):
                             continue
 
-                        line_sizes = [
-                            round(float(span.get("size", 0) or 0), 2)
-                            for span in spans
-                            if isinstance(span, dict) and span.get("text")
-                        ]
-                        dominant_size = max(line_sizes) if line_sizes else 0
-                        heading_level = size_to_heading.get(dominant_size, 0)
-
+                        # One pass over the spans for both the dominant size and
+                        # the text, with span.get bound once per span.
+                        dominant_size: float = 0
                         span_texts: List[str] = []
                         for span in spans:
                             if not isinstance(span, dict):
                                 continue
-                            text = span.get("text", "") or ""
+                            get = span.get
+                            text = get("text", "") or ""
+                            if text:
+                                raw_size = get("size", 0) or 0
+                                size = rounded_sizes.get(raw_size)
+                                if size is None:
+                                    size = round(float(raw_size), 2)
+                                if size > dominant_size:
+                                    dominant_size = size
                             if not text.strip():
                                 span_texts.append(text)
                                 continue
-                            fontname = span.get("font", "") or ""
-                            fontname_lower = fontname.lower()
-                            is_bold = (
-                                "bold" in fontname_lower or "black" in fontname_lower
-                            )
-                            is_italic = (
-                                "italic" in fontname_lower
-                                or "oblique" in fontname_lower
-                            )
+                            is_bold, is_italic = _font_flags(get("font", "") or "")
                             span_texts.append(_wrap_emphasis(text, is_bold, is_italic))
 
                         raw_line = _sanitize_md("".join(span_texts).strip())
                         if not raw_line:
                             continue
+                        heading_level = size_to_heading.get(dominant_size, 0)
 
-                        if re.match(r"^[\-\u2022\u2023\u25E6\u2043*o]\s+", raw_line):
-                            bullet_text = re.sub(
-                                r"^[\-\u2022\u2023\u25E6\u2043*o]\s+", "", raw_line
-                            )
-                            md_lines.append(f"- {bullet_text}")
+                        bullet = _BULLET_RE.match(raw_line)
+                        if bullet:
+                            out.write(f"- {raw_line[bullet.end():]}\n")
                             continue
 
-                        if heading_level:
-                            md_lines.append(f"{'#' * heading_level} {raw_line}")
-                        else:
-                            md_lines.append(raw_line)
+                        out.write(_HEADING_PREFIX[heading_level])
+                        out.write(raw_line + "\n")
 
                 elif block_type == 1 and include_images:
                     imginfo = (
@@ -183,32 +314,37 @@ def convert_pdf_to_md(
                     xref = imginfo.get("xref")
                     if not xref:
                         continue
+                    if xref in written:
+                        out.write(f"![image]({written[xref]})\n")
+                        continue
                     try:
-                        img_dict = doc.extract_image(xref)
+                        img_dict = extracted.get(xref)
+                        if img_dict is None:
+                            img_dict = extracted[xref] = doc.extract_image(xref)
                         img_bytes = img_dict.get("image")
                         if not isinstance(img_bytes, (bytes, bytearray)):
                             continue
-                        img_data = bytes(img_bytes)
                         img_ext = img_dict.get("ext", "png")
                         if images_dir:
-                            os.makedirs(images_dir, exist_ok=True)
                             img_name = f"page{page_number + 1}_img{xref}.{img_ext}"
                             img_path = os.path.join(images_dir, img_name)
-                            with open(img_path, "wb") as f:
-                                f.write(img_data)
-                            md_lines.append(f"![image]({img_path})")
+                            _write_bytes(img_path, img_bytes)
+                            written[xref] = img_path
+                            out.write(f"![image]({img_path})\n")
                         else:
-                            b64 = base64.b64encode(img_data).decode("ascii")
-                            md_lines.append(
-                                f"![image](data:image/{img_ext};base64,{b64})"
-                            )
+                            # Written piecewise so the encoded payload is not
+                            # copied again into an f-string.
+                            b64 = base64.b64encode(memoryview(img_bytes))
+                            out.write(f"![image](data:image/{img_ext};base64,")
+                            out.write(b64.decode("ascii"))
+                            out.write(")\n")
                     except Exception:
                         continue
 
             if page_number != total_pages - 1:
-                md_lines.append("\n---\n")
+                out.write("\n---\n\n")
 
-        return "\n".join(md_lines).strip()
+        return out.getvalue().strip()
     finally:
         doc.close()
 
@@ -217,28 +353,32 @@ def convert_docx_to_md(docx_path: str) -> str:
     if Document is None:
         raise ImportError("python-docx is required to process DOCX files.")
     doc = Document(docx_path)  # type: ignore[misc]
-    md_lines = []
+    out = io.StringIO()
 
     for para in doc.paragraphs:
         text = para.text.strip()
         if not text:
-            md_lines.append("")
+            out.write("\n\n")
             continue
 
-        style_name = para.style.name if para.style else ""
-        if style_name.lower().startswith("heading"):
+        # para.style resolves the style through the document XML on every access
+        style = para.style
+        style_name = (style.name or "") if style is not None else ""
+        style_lower = style_name.lower()
+        if style_lower.startswith("heading"):
             # Extract heading level digits, default to 1 if missing
-            digits = "".join(ch for ch in style_name if ch.isdigit())
-            level = max(1, min(int(digits or "1"), 6))
-            md_lines.append(f"{'#' * level} {text}")
+            digits = _HEADING_DIGIT_RE.search(style_name)
+            level = max(1, min(int(digits.group() if digits else "1"), 6))
+            out.write(_HEADING_PREFIX[level])
+            out.write(text + "\n\n")
 
-        elif "list" in style_name.lower():
-            md_lines.append(f"- {text}")
+        elif "list" in style_lower:
+            out.write(f"- {text}\n\n")
 
         else:
-            md_lines.append(text)
+            out.write(text + "\n\n")
 
-    return "\n\n".join(line for line in md_lines if line is not None).strip()
+    return out.getvalue().strip()
 
 
 def convert_document_to_md(path: str, **kwargs) -> str:
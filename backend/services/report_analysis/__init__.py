@@ -2,6 +2,8 @@
 this is a genai - langchain based resport financial report anaylsiser
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from .parameter_generation import generate_evaluation_parameters
 from .summary_generator import generate_report_summary
 from .parameter_evaluator import generate_evaluated_parameter_code
@@ -22,11 +24,17 @@ def report_analysis_pipeline(report: str) -> tuple[str, dict]:
     if not parameters:
         raise ValueError("Failed to generate evaluation parameters.")
 
-    # Step 2: Generate report summary
-    evaluated_parameters = generate_evaluated_parameter_code(report, parameters)
-    if not evaluated_parameters:
-        raise ValueError("Failed to generate evaluated parameters.")
-
-    summary = generate_report_summary(report, parameters)
+    # Step 2: Evaluate parameters and generate the summary; the two model calls
+    # are independent, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        evaluation_future = executor.submit(
+            generate_evaluated_parameter_code, report, parameters
+        )
+        summary_future = executor.submit(generate_report_summary, report, parameters)
+        evaluated_parameters = evaluation_future.result()
+        if not evaluated_parameters:
+            raise ValueError("Failed to generate evaluated parameters.")
+
+        summary = summary_future.result()
 
     return summary, evaluated_parameters
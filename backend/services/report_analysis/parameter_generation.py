@@ -5,6 +5,57 @@ from .types import EvaluationParameters
 import re
 import json
 
+_TRAILING_COMMA_RE = re.compile(r",\s*(\]|})")
+
+
+def _extract_json_text(raw: str) -> str:
+    """Pull the JSON payload out of a model reply that is not bare JSON.
+
+    Prefers a triple-backtick block (optionally tagged ``json``), then the
+    outermost ``[...]`` / ``{...}`` span, using plain ``str.find`` scans.
+    """
+    start = raw.find("```")
+    if start != -1:
+        end = raw.find("```", start + 3)
+        if end != -1:
+            body = raw[start + 3 : end]
+            if body[:4].lower() == "json":
+                body = body[4:]
+            return body.strip()
+
+    # first opener that has a matching closer somewhere after it
+    spans = []
+    for opener, closer in (("[", "]"), ("{", "}")):
+        first = raw.find(opener)
+        last = raw.rfind(closer)
+        if first != -1 and last > first:
+            spans.append((first, last))
+    if spans:
+        first, last = min(spans)
+        return raw[first : last + 1].strip()
+    return raw
+
+
+def _response_text(response) -> str:
+    """Text of a GenAI response, read from ``.text`` or the first candidate's parts.
+
+    Never stringifies the response object itself, whose repr is far larger
+    than the answer.
+    """
+    text = getattr(response, "text", None)
+    if isinstance(text, str) and text:
+        return text
+
+    candidates = getattr(response, "candidates", None)
+    if candidates:
+        content = getattr(candidates[0], "content", None)
+        parts = getattr(content, "parts", None) or []
+        return "".join(
+            part.text for part in parts if isinstance(getattr(part, "text", None), str)
+        )
+
+    return ""
+
 
 def generate_evaluation_parameters(report: str) -> list[EvaluationParameters] | None:
     """
@@ -77,39 +128,27 @@ Output only in structured JSON format — no narrative explanation.
         contents=[prompt],
     )
 
-    # extract a text representation from the response object
-    raw = ""
-    for attr in ("candidates", "output", "text", "content", "response"):
-        val = getattr(response, attr, None)
-        if val:
-            raw = val
-            break
-
-    if not isinstance(raw, str):
-        raw = str(raw)
-
-    # try to find JSON inside triple-backticks (optionally fenced as json)
-    m = re.search(r"```(?:json)?\s*(.*?)```", raw, re.S | re.I)
-    if m:
-        json_text = m.group(1).strip()
-
-    else:
-        # fallback: try to find the first JSON object/array in the text
-        m2 = re.search(r"(\[.*\]|\{.*\})", raw, re.S)
-        json_text = m2.group(1).strip() if m2 else raw
+    raw = _response_text(response).strip()
 
-    # attempt to parse JSON, with a simple cleanup for trailing commas
+    # the model usually answers with bare JSON; only dig for it when it doesn't
     try:
-        parsed = json.loads(json_text)
+        parsed = json.loads(raw)
 
     except json.JSONDecodeError:
-        cleaned = re.sub(r",\s*(\]|})", r"\1", json_text)
+        json_text = _extract_json_text(raw)
 
+        # attempt to parse JSON, with a simple cleanup for trailing commas
         try:
-            parsed = json.loads(cleaned)
+            parsed = json.loads(json_text)
 
-        except Exception:
-            return None
+        except json.JSONDecodeError:
+            cleaned = _TRAILING_COMMA_RE.sub(r"\1", json_text)
+
+            try:
+                parsed = json.loads(cleaned)
+
+            except Exception:
+                return None
 
     if isinstance(parsed, dict):
         parsed = [parsed]